@@ -4,42 +4,175 @@
 """
 import os
 import re
+import json
+import glob
 import time
+import hashlib
 import logging
 import subprocess
 import tempfile
-from typing import Dict, List, Any, Tuple, Optional, Set
+from typing import Dict, List, Any, Tuple, Optional, Set, NamedTuple, Iterator
+
+# google-re2 (если установлен) гарантирует линейное время сопоставления;
+# все используемые шаблоны совместимы и со стандартным модулем re
+try:
+    import re2 as _re
+except ImportError:
+    _re = re
 
 logger = logging.getLogger("cpu_tuner")
 
+# Размер буфера чтения дампа BIOS (дамп может занимать несколько МБ)
+DUMP_BUFFER_SIZE = 1 << 20
+
+# Каталог tmpfs в памяти для временных файлов (есть не на всех системах)
+SHM_DIR = "/dev/shm"
+
+# Версия формата кэша разбора дампа (увеличивать при изменении парсинга или категорий)
+PARSE_CACHE_VERSION = 1
+
+# Максимальный возраст бэкапа BIOS (в секундах), который используется повторно
+BACKUP_MAX_AGE = 3600
+
+# Буквенные записи, которые float() принимает как число
+_FLOAT_WORDS = frozenset({"inf", "infinity", "nan"})
+
+# Соответствие полей секции ключам словаря настроек
+_SECTION_FIELDS = {"BIOS Default": "default", "Token": "token", "Offset": "offset", "Width": "width"}
+
+# Строка вида "Ключ = Значение", начинающаяся с буквы; ключ - всё до первого "=".
+# Якорь "\n" вместо "^" с re.MULTILINE позволяет движку искать совпадения
+# по символу перевода строки, а не пробовать шаблон с каждой позиции
+_FIELD_RE = _re.compile(r"\n([^\W\d_][^=\n]*)=([^\n]*)")
+
+class SectionRecord(NamedTuple):
+    """Положение секции параметра в дампе BIOS"""
+    name: str                        # Название параметра (как в дампе)
+    start_line: int                  # Индекс строки "Setup Question"
+    end_line: int                    # Индекс строки после конца секции
+    value_line_idx: Optional[int]    # Индекс строки "Value" (если есть)
+    value_str: Optional[str]         # Значение из строки "Value" (если есть)
+
+class CoercedValue(NamedTuple):
+    """Значение параметра BIOS, приведенное к типу"""
+    value: Any                       # Типизированное значение
+    type: str                        # 'hex', 'int', 'float' или 'str'
+    raw: str                         # Исходная строка из дампа
+
+def _dump_dir() -> str:
+    """
+    Возвращает каталог для временных файлов дампа и скрипта SCEWIN.
+    
+    Если доступен tmpfs в памяти (/dev/shm), используется он, иначе
+    стандартный временный каталог.
+    """
+    if os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK):
+        return SHM_DIR
+    return tempfile.gettempdir()
+
+def _keyword_pattern(keywords) -> "re.Pattern":
+    """Компилирует набор ключевых слов в одно регулярное выражение-альтернативу"""
+    return _re.compile("|".join(map(re.escape, sorted(keywords))))
+
+def _group_union_pattern(groups: Dict[str, Any]) -> "re.Pattern":
+    """
+    Компилирует группы ключевых слов в одно выражение с именованной группой на каждую.
+    
+    Используется стандартный модуль re: для выбора группы нужен match.lastgroup.
+    """
+    return re.compile("|".join(f"(?P<{group}>{'|'.join(map(re.escape, sorted(keywords)))})"
+                               for group, keywords in groups.items()))
+
+def _first_matching_group(text: str, union_re: "re.Pattern",
+                          group_res: Dict[str, "re.Pattern"]) -> Optional[str]:
+    """
+    Возвращает первую по порядку group_res группу, ключевое слово которой есть в тексте.
+    
+    Один проход union_re отсекает текст без ключевых слов и дает группу самого левого
+    совпадения (lastgroup); отдельно проверяются только группы, стоящие до нее по порядку.
+    
+    Args:
+        text: Текст в нижнем регистре
+        union_re: Объединенное выражение из _group_union_pattern
+        group_res: Выражения групп в порядке приоритета
+        
+    Returns:
+        Имя группы или None, если ни одно ключевое слово не найдено
+    """
+    match = union_re.search(text)
+    if match is None:
+        return None
+    
+    found = match.lastgroup
+    for group, pattern in group_res.items():
+        if group == found or pattern.search(text):
+            return group
+    return found
+
 class BiosService:
     """
     Сервис для взаимодействия с BIOS через AMI SCEWIN.
     Позволяет читать и изменять настройки BIOS.
     """
     
-    # Ключевые слова для категоризации параметров
-    PERFORMANCE_KEYWORDS = [
-        'cpu', 'power', 'limit', 'ratio', 'turbo', 'boost', 'overclock', 'xmp', 'docp',
+    # Ключевые слова для категоризации параметров. Поиск идет по подстрокам,
+    # поэтому слова, уже содержащие другое слово набора ('c-states' -> 'c-state',
+    # 'hyper-threading' -> 'threading', 'base clock' -> 'clock'), не перечисляются
+    PERFORMANCE_KEYWORDS = frozenset({
+        'cpu', 'power', 'limit', 'ratio', 'turbo', 'boost', 'xmp', 'docp',
         'performance', 'frequency', 'clock', 'c-state', 'voltage', 'vcore', 'offset',
-        'c-states', 'multiplier', 'tdp', 'pl1', 'pl2', 'ppt', 'tdc', 'edc', 'smt',
-        'hyper-threading', 'threading', 'avx', 'memory', 'dram', 'timing', 'speed',
-        'bclk', 'base clock', 'intel speed step', 'speedstep', 'coolnquiet', 'cool n quiet'
-    ]
+        'multiplier', 'tdp', 'pl1', 'pl2', 'ppt', 'tdc', 'edc', 'smt',
+        'threading', 'avx', 'memory', 'dram', 'timing', 'speed',
+        'bclk', 'coolnquiet', 'cool n quiet'
+    })
     
     # Категории параметров
     PARAM_CATEGORIES = {
-        'cpu_power': ['power limit', 'pl1', 'pl2', 'ppt', 'tdc', 'edc', 'tdp'],
-        'cpu_freq': ['ratio', 'multiplier', 'turbo', 'boost', 'frequency', 'clock', 'bclk'],
-        'cpu_voltage': ['voltage', 'vcore', 'offset', 'vid'],
-        'memory': ['memory', 'dram', 'ram', 'xmp', 'docp', 'timing'],
-        'cpu_features': ['c-state', 'hyper', 'threading', 'smt', 'avx', 'speedstep', 'coolnquiet']
+        'cpu_power': frozenset({'power limit', 'pl1', 'pl2', 'ppt', 'tdc', 'edc', 'tdp'}),
+        'cpu_freq': frozenset({'ratio', 'multiplier', 'turbo', 'boost', 'frequency', 'clock', 'bclk'}),
+        'cpu_voltage': frozenset({'voltage', 'vcore', 'offset', 'vid'}),
+        'memory': frozenset({'memory', 'ram', 'xmp', 'docp', 'timing'}),
+        'cpu_features': frozenset({'c-state', 'hyper', 'threading', 'smt', 'avx', 'speedstep', 'coolnquiet'})
     }
     
     # Параметры, требующие перезагрузку
-    REBOOT_REQUIRED_PARAMS = [
+    REBOOT_REQUIRED_PARAMS = frozenset({
         'memory', 'xmp', 'docp', 'bclk', 'base clock', 'smt', 'hyper-threading'
-    ]
+    })
+    
+    # Ключевые слова для поиска параметров по группам
+    POWER_LIMIT_KEYWORDS = frozenset({
+        'power limit', 'tdp', 'thermal design power', 'pl1', 'pl2', 
+        'long duration', 'short duration', 'package power', 'ppt', 
+        'tdc', 'edc', 'power target'
+    })
+    VOLTAGE_KEYWORDS = frozenset({'voltage', 'vcore', 'offset', 'vid', 'core volt'})
+    XMP_KEYWORDS = frozenset({'xmp', 'docp', 'memory profile'})
+    CSTATE_KEYWORDS = frozenset({'c-state', 'c state', 'c1e', 'c3', 'c6', 'c7'})
+    TURBO_KEYWORDS = frozenset({'turbo', 'boost', 'core performance'})
+    
+    # Группы для find_all_performance_parameters (проверяются по порядку)
+    PERFORMANCE_GROUPS = {
+        'power': frozenset({'power', 'limit', 'tdp', 'pl1', 'pl2', 'ppt'}),
+        'voltage': frozenset({'voltage', 'vcore', 'offset', 'vid'}),
+        'memory': frozenset({'memory', 'ram', 'xmp', 'docp'}),
+        'cstates': frozenset({'c-state', 'c state', 'c1e', 'c3', 'c6'}),
+        'turbo': frozenset({'turbo', 'boost'}),
+        'cpu_features': frozenset({'smt', 'hyper', 'thread', 'virtualization'})
+    }
+    
+    # Скомпилированные шаблоны ключевых слов
+    _PERF_RE = _keyword_pattern(PERFORMANCE_KEYWORDS)
+    _REBOOT_RE = _keyword_pattern(REBOOT_REQUIRED_PARAMS)
+    _CATEGORY_RES = {cat: _keyword_pattern(kws) for cat, kws in PARAM_CATEGORIES.items()}
+    _POWER_RE = _keyword_pattern(POWER_LIMIT_KEYWORDS)
+    _VOLTAGE_RE = _keyword_pattern(VOLTAGE_KEYWORDS)
+    _XMP_RE = _keyword_pattern(XMP_KEYWORDS)
+    _CSTATE_RE = _keyword_pattern(CSTATE_KEYWORDS)
+    _TURBO_RE = _keyword_pattern(TURBO_KEYWORDS)
+    _GROUP_RES = {group: _keyword_pattern(kws) for group, kws in PERFORMANCE_GROUPS.items()}
+    _CATEGORY_UNION_RE = _group_union_pattern(PARAM_CATEGORIES)
+    _GROUP_UNION_RE = _group_union_pattern(PERFORMANCE_GROUPS)
     
     def __init__(self, scewin_path: str):
         """
@@ -49,10 +182,22 @@ class BiosService:
             scewin_path: Путь к утилите SCEWIN_x64.exe
         """
         self.tool_path = scewin_path
-        self.dump_file = os.path.join(tempfile.gettempdir(), "bios_out.txt")
-        self.script_file = os.path.join(tempfile.gettempdir(), "bios_set.txt")
+        self.dump_dir = _dump_dir()
+        self.dump_file = os.path.join(self.dump_dir, "bios_out.txt")
+        self.script_file = os.path.join(self.dump_dir, "bios_set.txt")
+        # Бэкап должен пережить перезагрузку, поэтому он всегда хранится на диске
         self.backup_file = os.path.join(tempfile.gettempdir(), "bios_backup.txt")
         
+        # Кэш строк последнего дампа BIOS (сбрасывается после изменения настроек)
+        self._dump_lines: Optional[List[str]] = None
+        self._dump_dirty = True
+        
+        # Строковая форма дампа, индекс секций и результат парсинга, построенные по кэшу
+        self._dump_cache: Optional[str] = None
+        self._parsed_index: Optional[Dict[str, SectionRecord]] = None
+        self._settings_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._classified: Optional[Dict[str, Any]] = None
+        
         # Проверка наличия утилиты SCEWIN
         if not os.path.exists(self.tool_path):
             error_msg = f"Утилита SCEWIN не найдена по пути: {self.tool_path}"
@@ -61,66 +206,310 @@ class BiosService:
         
         logger.info(f"BiosService инициализирован. SCEWIN: {self.tool_path}")
         
-        # Создаем backup текущего BIOS при инициализации
+        # Бэкап текущего BIOS создается перед первым изменением настроек;
+        # свежий бэкап (моложе BACKUP_MAX_AGE) от прошлого запуска используется повторно
+        self._backup_done = (os.path.exists(self.backup_file) and
+                             time.time() - os.path.getmtime(self.backup_file) < BACKUP_MAX_AGE)
+    
+    def _ensure_backup(self) -> None:
+        """
+        Создает бэкап настроек BIOS, если он еще не был создан.
+        
+        Ошибка создания бэкапа не прерывает изменение настроек - она только логируется,
+        а попытка повторяется при следующем изменении.
+        """
+        if self._backup_done:
+            return
+        
         try:
-            script = self._export_all(self.backup_file)
+            self._run_export(self.backup_file)
+            self._backup_done = True
             logger.info(f"Создан бэкап настроек BIOS в {self.backup_file}")
         except Exception as e:
             logger.warning(f"Не удалось создать бэкап настроек BIOS: {e}")
     
-    def _export_all(self, out_file: str) -> str:
+    def refresh(self) -> None:
         """
-        Экспортирует все настройки BIOS в указанный файл и возвращает содержимое.
+        Сбрасывает кэш дампа BIOS. Следующее чтение заново вызовет SCEWIN.
+        """
+        self._invalidate()
+    
+    def _invalidate(self) -> None:
+        """Помечает кэш дампа и построенные по нему индексы устаревшими"""
+        self._dump_dirty = True
+        self._dump_lines = None
+        self._dump_cache = None
+        self._parsed_index = None
+        self._settings_cache = None
+        self._classified = None
+    
+    @staticmethod
+    def _decode_stderr(stderr: Optional[bytes]) -> str:
+        """Декодирует stderr SCEWIN (вызывается только при ошибке)"""
+        if not stderr:
+            return ""
+        return stderr.decode('utf-8', 'replace').strip()
+    
+    def _run_export(self, out_file: str) -> None:
+        """
+        Запускает экспорт всех настроек BIOS через SCEWIN в указанный файл.
         
         Args:
             out_file: Путь для сохранения настроек BIOS
             
-        Returns:
-            Содержимое экспортированного файла
-            
         Raises:
             IOError: Если экспорт не удался
         """
         logger.debug(f"Экспорт настроек BIOS в {out_file}")
         
         try:
-            result = subprocess.run(
+            subprocess.run(
                 [self.tool_path, "/o", "/s", out_file],
-                capture_output=True,
-                text=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 check=True
             )
-            
-            if not os.path.exists(out_file):
-                error_msg = f"Экспорт AMISCE не удался: выходной файл {out_file} не создан"
-                logger.error(error_msg)
-                raise IOError(error_msg)
-                
-            with open(out_file, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-                
-            if not content.strip():
-                error_msg = "Экспорт AMISCE вернул пустой файл"
-                logger.error(error_msg)
-                raise IOError(error_msg)
-                
-            logger.debug(f"Экспорт настроек BIOS успешен: {len(content)} байт")
-            return content
         except subprocess.CalledProcessError as e:
-            error_msg = f"Ошибка вызова AMISCE: код {e.returncode}, сообщение: {e.stderr}"
+            error_msg = f"Ошибка вызова AMISCE: код {e.returncode}, сообщение: {self._decode_stderr(e.stderr)}"
             logger.error(error_msg)
             raise IOError(error_msg)
         except Exception as e:
             error_msg = f"Ошибка при экспорте настроек BIOS: {str(e)}"
             logger.error(error_msg)
             raise IOError(error_msg)
+        
+        if not os.path.exists(out_file):
+            error_msg = f"Экспорт AMISCE не удался: выходной файл {out_file} не создан"
+            logger.error(error_msg)
+            raise IOError(error_msg)
     
-    def get_setting_value(self, question_name: str) -> int:
+    @staticmethod
+    def _iter_dump_lines(path: str) -> Iterator[str]:
+        """
+        Построчно читает дамп BIOS через буферизованный файл.
+        
+        Args:
+            path: Путь к файлу дампа
+            
+        Yields:
+            Строки дампа без символов перевода строки
+        """
+        with open(path, 'r', encoding='utf-8', errors='replace', buffering=DUMP_BUFFER_SIZE) as f:
+            for line in f:
+                yield line.rstrip('\r\n')
+    
+    def _get_dump_lines(self) -> List[str]:
+        """
+        Возвращает строки текущего дампа BIOS.
+        
+        Дамп экспортируется и читается за один проход, затем кэшируется
+        до следующего изменения настроек или явного вызова refresh().
+        
+        Returns:
+            Список строк дампа
+            
+        Raises:
+            IOError: Если экспорт не удался
+        """
+        if not self._dump_dirty and self._dump_lines is not None:
+            return self._dump_lines
+        
+        self._run_export(self.dump_file)
+        
+        try:
+            lines = list(self._iter_dump_lines(self.dump_file))
+        except OSError as e:
+            error_msg = f"Ошибка при чтении дампа BIOS: {str(e)}"
+            logger.error(error_msg)
+            raise IOError(error_msg)
+        
+        if not any(line.strip() for line in lines):
+            error_msg = "Экспорт AMISCE вернул пустой файл"
+            logger.error(error_msg)
+            raise IOError(error_msg)
+        
+        logger.debug(f"Экспорт настроек BIOS успешен: {len(lines)} строк")
+        self._invalidate()
+        self._dump_lines = lines
+        self._dump_dirty = False
+        return lines
+    
+    def _export_all(self, out_file: str) -> str:
+        """
+        Экспортирует все настройки BIOS в указанный файл и возвращает содержимое.
+        
+        Для self.dump_file содержимое собирается из кэша строк дампа.
+        
+        Args:
+            out_file: Путь для сохранения настроек BIOS
+            
+        Returns:
+            Содержимое экспортированного файла
+            
+        Raises:
+            IOError: Если экспорт не удался
+        """
+        if out_file == self.dump_file:
+            lines = self._get_dump_lines()
+            if self._dump_cache is None:
+                self._dump_cache = "\n".join(lines)
+            return self._dump_cache
+        
+        self._run_export(out_file)
+        
+        try:
+            with open(out_file, 'r', encoding='utf-8', errors='replace', buffering=DUMP_BUFFER_SIZE) as f:
+                content = f.read()
+        except OSError as e:
+            error_msg = f"Ошибка при чтении экспорта BIOS: {str(e)}"
+            logger.error(error_msg)
+            raise IOError(error_msg)
+            
+        if not content.strip():
+            error_msg = "Экспорт AMISCE вернул пустой файл"
+            logger.error(error_msg)
+            raise IOError(error_msg)
+            
+        logger.debug(f"Экспорт настроек BIOS успешен: {len(content)} байт")
+        return content
+    
+    @staticmethod
+    def _build_index(lines: List[str]) -> Dict[str, SectionRecord]:
+        """
+        Строит индекс секций дампа за один проход по строкам.
+        
+        Args:
+            lines: Строки дампа BIOS
+            
+        Returns:
+            Словарь {название_параметра_в_нижнем_регистре: SectionRecord}
+        """
+        index = {}
+        name = None
+        start = 0
+        value_idx = None
+        value_str = None
+        
+        def close_section(end):
+            if name is not None:
+                # При дубликатах сохраняем первую секцию, как и при линейном поиске
+                index.setdefault(name.lower(), SectionRecord(name, start, end, value_idx, value_str))
+        
+        for i, line in enumerate(lines):
+            # Строки секции начинаются с буквы; остальные проверяем только на пустоту
+            if not line[:1].isalpha():
+                if name is not None and not line.strip():
+                    # Пустая строка - конец секции
+                    close_section(i)
+                    name = None
+                continue
+            
+            if line.startswith("Setup Question"):
+                close_section(i)
+                parts = line.split("=", 1)
+                name = parts[1].strip() if len(parts) == 2 else line.strip()
+                start = i
+                value_idx = None
+                value_str = None
+            elif name is not None and value_idx is None and line.startswith("Value"):
+                value_idx = i
+                parts = line.split("=", 1)
+                value_str = parts[1].strip() if len(parts) == 2 else None
+        
+        close_section(len(lines))
+        return index
+    
+    def _load_dump(self, content: Optional[str] = None) -> Tuple[List[str], Dict[str, SectionRecord]]:
+        """
+        Возвращает строки дампа и индекс секций.
+        
+        Для кэшированного дампа индекс строится один раз и переиспользуется.
+        
+        Args:
+            content: Готовый дамп BIOS (если не указан, используется кэш/экспорт)
+            
+        Returns:
+            Кортеж (строки дампа, индекс секций)
+        """
+        if content is not None:
+            lines = content.splitlines()
+            return lines, self._build_index(lines)
+        
+        lines = self._get_dump_lines()
+        if self._parsed_index is None:
+            self._parsed_index = self._build_index(lines)
+        return lines, self._parsed_index
+    
+    @staticmethod
+    def _find_section(question_name: str, index: Dict[str, SectionRecord]) -> Optional[SectionRecord]:
+        """
+        Ищет секцию параметра: сначала точное совпадение имени, затем по вхождению подстроки.
+        
+        Args:
+            question_name: Название параметра BIOS
+            index: Индекс секций дампа
+            
+        Returns:
+            Найденная секция или None
+        """
+        q_lower = question_name.lower()
+        record = index.get(q_lower)
+        if record is not None:
+            return record
+        
+        for name_lower, candidate in index.items():
+            if q_lower in name_lower:
+                return candidate
+        return None
+    
+    @staticmethod
+    def _coerce_value(val_str: str) -> CoercedValue:
+        """
+        Приводит строковое значение из дампа BIOS к типу.
+        
+        Порядок проверок: шестнадцатеричное с префиксом 0x, шестнадцатеричное
+        с суффиксом h, целое, дробное; все остальное остается строкой.
+        
+        Args:
+            val_str: Значение из строки Value
+            
+        Returns:
+            Типизированное значение, его тип и исходная строка
+        """
+        val_lower = val_str.lower()
+        try:
+            if val_lower[:2] == "0x":
+                return CoercedValue(int(val_str[2:], 16), "hex", val_str)
+            if val_lower[-1:] == "h":
+                return CoercedValue(int(val_str[:-1], 16), "hex", val_str)
+        except ValueError:
+            return CoercedValue(val_str, "str", val_str)
+        
+        # Типичные значения (десятичные цифры или слова вроде Auto/Enabled)
+        # распознаются проверкой символов, без создания исключений
+        if val_str.isdigit() and val_str.isascii():
+            return CoercedValue(int(val_str), "int", val_str)
+        if val_str.isalpha() and val_lower not in _FLOAT_WORDS:
+            return CoercedValue(val_str, "str", val_str)
+        
+        # Редкие форматы (знак, дробная часть, экспонента) разбирает int()/float()
+        try:
+            return CoercedValue(int(val_str), "int", val_str)
+        except ValueError:
+            pass
+        try:
+            return CoercedValue(float(val_str), "float", val_str)
+        except ValueError:
+            return CoercedValue(val_str, "str", val_str)
+    
+    def get_setting_value(self, question_name: str, content: Optional[str] = None) -> int:
         """
         Получает текущее значение параметра BIOS.
         
         Args:
             question_name: Название параметра BIOS
+            content: Готовый дамп BIOS (если не указан, используется кэш/экспорт)
             
         Returns:
             Текущее значение параметра как целое число
@@ -129,56 +518,32 @@ class BiosService:
             KeyError: Если параметр не найден
             ValueError: Если не удалось распарсить значение
         """
-        script = self._export_all(self.dump_file)
-        lines = script.splitlines()
+        _, index = self._load_dump(content)
+        record = self._find_section(question_name, index)
         
-        # Поиск секции для запрошенного параметра
-        found_section = False
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if line.startswith("Setup Question") and question_name.lower() in line.lower():
-                found_section = True
-                # Поиск строки Value в следующих 10 строках
-                for j in range(i, min(i+10, len(lines))):
-                    val_line = lines[j].strip()
-                    if val_line.startswith("Value"):
-                        # Парсинг значения
-                        val_parts = val_line.split('=')
-                        if len(val_parts) < 2:
-                            raise ValueError(f"Некорректный формат строки Value для {question_name}")
-                        
-                        val_str = val_parts[1].strip()
-                        
-                        # Обработка шестнадцатеричных форматов
-                        if val_str.lower().startswith("0x"):
-                            return int(val_str[2:], 16)
-                        if val_str.lower().endswith("h"):
-                            return int(val_str[:-1], 16)
-                            
-                        # Обработка десятичных значений
-                        try:
-                            return int(val_str)
-                        except ValueError:
-                            # Если это не целое число, пробуем преобразовать float и округлить
-                            try:
-                                return int(float(val_str))
-                            except ValueError:
-                                # Если это текстовое значение, возвращаем хэш строки как число
-                                # Это хак для обработки неожиданных форматов
-                                logger.warning(f"Нечисловое значение для {question_name}: {val_str}")
-                                return hash(val_str) % 10000
-        
-        if not found_section:
+        if record is None:
             raise KeyError(f"Параметр BIOS '{question_name}' не найден")
-        else:
+        if record.value_line_idx is None:
             raise ValueError(f"Найден параметр '{question_name}', но не удалось определить его значение")
+        if record.value_str is None:
+            raise ValueError(f"Некорректный формат строки Value для {question_name}")
+        
+        coerced = self._coerce_value(record.value_str)
+        if coerced.type == "float":
+            # Дробное значение округляем до целого
+            return int(coerced.value)
+        if coerced.type == "str":
+            logger.warning(f"Нечисловое значение для {question_name}: {coerced.raw}")
+            raise ValueError(f"Нечисловое значение параметра {question_name}: {coerced.raw}")
+        return coerced.value
     
-    def get_setting_type(self, question_name: str) -> str:
+    def get_setting_type(self, question_name: str, content: Optional[str] = None) -> str:
         """
         Определяет тип параметра BIOS (целое число, строка, булево значение).
         
         Args:
             question_name: Название параметра BIOS
+            content: Готовый дамп BIOS (если не указан, используется кэш/экспорт)
             
         Returns:
             Тип параметра ('int', 'str', 'bool')
@@ -186,117 +551,105 @@ class BiosService:
         Raises:
             KeyError: Если параметр не найден
         """
-        script = self._export_all(self.dump_file)
-        lines = script.splitlines()
+        _, index = self._load_dump(content)
+        record = self._find_section(question_name, index)
         
-        # Поиск секции для запрошенного параметра
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if line.startswith("Setup Question") and question_name.lower() in line.lower():
-                # Поиск строки Value в следующих 10 строках
-                for j in range(i, min(i+10, len(lines))):
-                    val_line = lines[j].strip()
-                    if val_line.startswith("Value"):
-                        val_str = val_line.split('=')[1].strip()
-                        
-                        # Проверка на булево значение
-                        if val_str in ['0', '1']:
-                            return 'bool'
-                        
-                        # Проверка на шестнадцатеричное или десятичное число
-                        if val_str.lower().startswith("0x") or val_str.lower().endswith("h"):
-                            return 'int'
-                        
-                        try:
-                            int(val_str)
-                            return 'int'
-                        except ValueError:
-                            try:
-                                float(val_str)
-                                return 'float'
-                            except ValueError:
-                                return 'str'
-        
-        raise KeyError(f"Параметр BIOS '{question_name}' не найден")
-    
-    def set_setting_value(self, question_name: str, new_value: Any) -> None:
+        if record is None or record.value_str is None:
+            raise KeyError(f"Параметр BIOS '{question_name}' не найден")
+        
+        val_str = record.value_str
+        
+        # Проверка на булево значение
+        if val_str in ['0', '1']:
+            return 'bool'
+        
+        # Шестнадцатеричные значения считаются целыми
+        value_type = self._coerce_value(val_str).type
+        return 'int' if value_type == "hex" else value_type
+    
+    def _build_section_script(self, question_name: str, new_value: Any, lines: List[str],
+                              index: Dict[str, SectionRecord]) -> List[str]:
         """
-        Устанавливает новое значение параметра BIOS.
+        Формирует секцию скрипта SCEWIN с новым значением параметра.
         
         Args:
             question_name: Название параметра BIOS
             new_value: Новое значение
+            lines: Строки дампа BIOS
+            index: Индекс секций дампа
+            
+        Returns:
+            Строки секции параметра с замененной строкой Value
             
         Raises:
             KeyError: Если параметр не найден
-            IOError: Если импорт не удался
         """
-        script = self._export_all(self.dump_file)
-        lines = script.splitlines()
-        
-        section_lines = []
-        in_section = False
-        found = False
+        record = self._find_section(question_name, index)
         
-        # Поиск и модификация секции параметра
-        for i, line in enumerate(lines):
-            line_trimmed = line.strip()
-            
-            if not in_section:
-                if line_trimmed.startswith("Setup Question") and question_name.lower() in line.lower():
-                    # Начинаем захват блока настройки
-                    in_section = True
-                    found = True
-                    section_lines.append(line)
-            else:
-                # Мы внутри целевой секции
-                if line_trimmed.startswith("Setup Question") or len(line_trimmed) == 0:
-                    # Достигнут следующий вопрос или пустая строка - конец секции
-                    break
-                
-                if line_trimmed.startswith("Value"):
-                    # Заменяем строку Value на новое значение
-                    prefix = line[:line.index('=')+1]
-                    old_val_str = line.split('=')[1].strip()
-                    
-                    # Форматируем новое значение в том же формате, что и старое
-                    if isinstance(new_value, bool):
-                        # Для булевых значений (0 или 1)
-                        new_val_str = "1" if new_value else "0"
-                    elif old_val_str.lower().startswith("0x") or old_val_str.lower().endswith("h"):
-                        # Для шестнадцатеричных значений
-                        new_val_str = f"0x{int(new_value):X}"
-                    else:
-                        # Для других значений
-                        new_val_str = str(new_value)
-                    
-                    section_lines.append(f"{prefix} {new_val_str}")
-                    logger.debug(f"Изменяем значение {question_name}: {old_val_str} -> {new_val_str}")
-                else:
-                    # Остальные строки (Token, Offset, Width и т.д.) оставляем без изменений
-                    section_lines.append(line)
-        
-        if not found:
+        if record is None:
             error_msg = f"Параметр '{question_name}' не найден, невозможно установить значение"
             logger.error(error_msg)
             raise KeyError(error_msg)
         
-        # Запись блока в временный скрипт
-        with open(self.script_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(section_lines))
+        # Копируем секцию параметра, заменяя строку Value на новое значение
+        # (остальные строки - Token, Offset, Width и т.д. - оставляем без изменений)
+        section_lines = lines[record.start_line:record.end_line]
+        if record.value_line_idx is not None:
+            line = lines[record.value_line_idx]
+            prefix = line[:line.index('=')+1]
+            old_val_str = line.split('=')[1].strip()
+            
+            # Форматируем новое значение в том же формате, что и старое
+            if isinstance(new_value, bool):
+                # Для булевых значений (0 или 1)
+                new_val_str = "1" if new_value else "0"
+            elif self._coerce_value(old_val_str).type == "hex":
+                # Для шестнадцатеричных значений
+                new_val_str = f"0x{int(new_value):X}"
+            else:
+                # Для других значений
+                new_val_str = str(new_value)
+            
+            section_lines[record.value_line_idx - record.start_line] = f"{prefix} {new_val_str}"
+            logger.debug(f"Изменяем значение {question_name}: {old_val_str} -> {new_val_str}")
         
-        # Импорт (применение) скрипта с измененным значением
-        logger.info(f"Применение изменения параметра BIOS: {question_name} = {new_value}")
+        return section_lines
+    
+    def _write_script(self, sections: List[List[str]]) -> None:
+        """
+        Записывает секции параметров в self.script_file (секции разделяются пустой строкой).
+        
+        Строки передаются в буферизованный файл по одной, без сборки всего скрипта
+        в одну строку. Перевод строк остается платформенным (CRLF в Windows),
+        как в дампе, который формирует SCEWIN.
+        
+        Args:
+            sections: Строки секций скрипта
+        """
+        with open(self.script_file, 'w', encoding='utf-8', buffering=DUMP_BUFFER_SIZE) as f:
+            for i, section in enumerate(sections):
+                if i:
+                    f.write('\n')
+                f.writelines(line + '\n' for line in section)
+    
+    def _import_script(self) -> None:
+        """
+        Импортирует (применяет) скрипт self.script_file через SCEWIN.
+        
+        Raises:
+            IOError: Если импорт не удался
+        """
         try:
-            result = subprocess.run(
+            subprocess.run(
                 [self.tool_path, "/i", "/s", self.script_file],
-                capture_output=True,
-                text=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 check=True
             )
-            logger.info(f"Параметр BIOS {question_name} успешно изменен на {new_value}")
+            self._invalidate()
         except subprocess.CalledProcessError as e:
-            error_msg = f"Ошибка импорта AMISCE: код {e.returncode}, сообщение: {e.stderr}"
+            error_msg = f"Ошибка импорта AMISCE: код {e.returncode}, сообщение: {self._decode_stderr(e.stderr)}"
             logger.error(error_msg)
             raise IOError(error_msg)
         except Exception as e:
@@ -304,125 +657,324 @@ class BiosService:
             logger.error(error_msg)
             raise IOError(error_msg)
     
+    def set_setting_value(self, question_name: str, new_value: Any,
+                          content: Optional[str] = None) -> None:
+        """
+        Устанавливает новое значение параметра BIOS.
+        
+        Args:
+            question_name: Название параметра BIOS
+            new_value: Новое значение
+            content: Готовый дамп BIOS (если не указан, используется кэш/экспорт)
+            
+        Raises:
+            KeyError: Если параметр не найден
+            IOError: Если импорт не удался
+        """
+        lines, index = self._load_dump(content)
+        section_lines = self._build_section_script(question_name, new_value, lines, index)
+        
+        self._ensure_backup()
+        
+        # Запись блока в временный скрипт
+        self._write_script([section_lines])
+        
+        # Импорт (применение) скрипта с измененным значением
+        logger.info(f"Применение изменения параметра BIOS: {question_name} = {new_value}")
+        self._import_script()
+        logger.info(f"Параметр BIOS {question_name} успешно изменен на {new_value}")
+    
+    def set_setting_values(self, values: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Устанавливает значения нескольких параметров BIOS одним вызовом SCEWIN.
+        
+        Не найденные параметры пропускаются, остальные применяются одним скриптом.
+        Если пакетный импорт не удался, параметры применяются по одному,
+        чтобы установить все, что возможно.
+        
+        Args:
+            values: Словарь {название_параметра: новое_значение}
+            
+        Returns:
+            Словарь {название_параметра: сообщение об ошибке} для параметров,
+            которые не удалось установить (пустой, если все применено)
+        """
+        errors = {}
+        if not values:
+            return errors
+        
+        lines, index = self._load_dump()
+        sections = []
+        applied = {}
+        for name, value in values.items():
+            try:
+                sections.append(self._build_section_script(name, value, lines, index))
+                applied[name] = value
+            except KeyError as e:
+                # str() у KeyError заключает сообщение в кавычки
+                errors[name] = e.args[0]
+        
+        if not applied:
+            return errors
+        
+        self._ensure_backup()
+        
+        # Запись всех секций в один скрипт
+        self._write_script(sections)
+        
+        logger.info(f"Пакетное применение {len(applied)} параметров BIOS: {applied}")
+        try:
+            self._import_script()
+            logger.info(f"Параметры BIOS успешно изменены: {list(applied)}")
+            return errors
+        except IOError as e:
+            if len(applied) == 1:
+                errors.update(dict.fromkeys(applied, str(e)))
+                return errors
+            logger.warning("Пакетный импорт не удался, применение параметров по одному")
+        
+        for name, value in applied.items():
+            try:
+                self.set_setting_value(name, value)
+            except KeyError as e:
+                errors[name] = e.args[0]
+            except IOError as e:
+                errors[name] = str(e)
+        
+        if errors:
+            logger.error(f"Не удалось установить параметры BIOS: {list(errors)}")
+        return errors
+    
     def parse_all_bios_settings(self) -> Dict[str, Dict[str, Any]]:
         """
         Парсит все настройки BIOS и возвращает их в виде словаря.
         
+        Результат сохраняется на диск с ключом по хэшу дампа: если BIOS не менялся
+        с прошлого запуска, повторный парсинг не выполняется.
+        
+        Returns:
+            Словарь вида {название_параметра: {value, type, description, ...}}
+        """
+        content = self._export_all(self.dump_file)
+        if self._settings_cache is not None:
+            return self._settings_cache
+        
+        cache_file = self._parse_cache_file(content)
+        settings = self._load_parse_cache(cache_file)
+        if settings is None:
+            settings = self._parse_settings(content)
+            self._save_parse_cache(cache_file, settings)
+        
+        self._settings_cache = settings
+        return settings
+    
+    def _parse_cache_file(self, content: str) -> str:
+        """
+        Возвращает путь к файлу кэша разбора для данного содержимого дампа.
+        
+        Args:
+            content: Содержимое дампа BIOS
+            
+        Returns:
+            Путь вида {dump_file}.{хэш}.json
+        """
+        digest = hashlib.blake2b(content.encode('utf-8', errors='replace'), digest_size=16)
+        digest.update(str(PARSE_CACHE_VERSION).encode())
+        return f"{self.dump_file}.{digest.hexdigest()}.json"
+    
+    @staticmethod
+    def _load_parse_cache(cache_file: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Загружает результат разбора дампа из файла кэша.
+        
+        Args:
+            cache_file: Путь к файлу кэша
+            
+        Returns:
+            Настройки BIOS или None, если кэша нет или он поврежден
+        """
+        if not os.path.exists(cache_file):
+            return None
+        
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                settings = json.load(f)
+            logger.info(f"Настройки BIOS загружены из кэша: {len(settings)} параметров")
+            return settings
+        except (OSError, ValueError) as e:
+            logger.warning(f"Не удалось прочитать кэш настроек BIOS: {e}")
+            return None
+    
+    def _save_parse_cache(self, cache_file: str, settings: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Сохраняет результат разбора дампа и удаляет кэши от прежних дампов.
+        
+        Args:
+            cache_file: Путь к файлу кэша
+            settings: Настройки BIOS
+        """
+        for old_file in glob.glob(f"{glob.escape(self.dump_file)}.*.json"):
+            if old_file != cache_file:
+                try:
+                    os.remove(old_file)
+                except OSError:
+                    pass
+        
+        try:
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(settings, f, ensure_ascii=False, separators=(',', ':'))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Не удалось сохранить кэш настроек BIOS: {e}")
+    
+    def _parse_settings(self, content: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Разбирает содержимое дампа BIOS в словарь настроек.
+        
+        Args:
+            content: Содержимое дампа BIOS
+            
         Returns:
             Словарь вида {название_параметра: {value, type, description, ...}}
         """
         logger.info("Парсинг всех настроек BIOS")
-        script = self._export_all(self.dump_file)
-        lines = script.splitlines()
         
         settings = {}
         current_setting = None
         setting_data = {}
         
-        for line in lines:
-            line = line.strip()
+        # Ключи словаря настроек для полей дампа: имена полей повторяются в каждой
+        # секции, поэтому lower()/replace() выполняются один раз на имя, а не на строку
+        field_keys: Dict[str, str] = {}
+        
+        # Пустые строки, комментарии и продолжения списка Options не начинаются
+        # с буквы и не содержат "=" - регулярное выражение их просто пропускает
+        for raw_key, value in _FIELD_RE.findall("\n" + content):
+            key = raw_key.strip()
+            value = value.strip()
             
             # Начало нового параметра
-            if line.startswith("Setup Question"):
+            if key.startswith("Setup Question"):
                 # Сохраняем предыдущий параметр, если он был
                 if current_setting and setting_data:
                     settings[current_setting] = setting_data
                 
                 # Начинаем новый параметр
-                parts = line.split("=", 1)
-                if len(parts) == 2:
-                    current_setting = parts[1].strip()
-                    setting_data = {
-                        "name": current_setting,
-                        "raw_name": current_setting,
-                        "category": self._categorize_parameter(current_setting),
-                        "requires_reboot": self._requires_reboot(current_setting),
-                        "is_performance_related": self._is_performance_related(current_setting)
-                    }
+                current_setting = value
+                # (категория и признаки заполняются пакетно после разбора)
+                setting_data = {
+                    "name": current_setting,
+                    "raw_name": current_setting
+                }
+                continue
+            
+            if not current_setting:
+                continue
             
             # Детали текущего параметра
-            elif current_setting and "=" in line:
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip()
-                
-                if key == "Value":
-                    # Парсинг значения
-                    if value.lower().startswith("0x"):
-                        try:
-                            setting_data["value"] = int(value[2:], 16)
-                            setting_data["value_raw"] = value
-                            setting_data["type"] = "hex"
-                        except ValueError:
-                            setting_data["value"] = value
-                            setting_data["type"] = "str"
-                    elif value.lower().endswith("h"):
-                        try:
-                            setting_data["value"] = int(value[:-1], 16)
-                            setting_data["value_raw"] = value
-                            setting_data["type"] = "hex"
-                        except ValueError:
-                            setting_data["value"] = value
-                            setting_data["type"] = "str"
-                    else:
-                        try:
-                            setting_data["value"] = int(value)
-                            setting_data["value_raw"] = value
-                            setting_data["type"] = "int"
-                        except ValueError:
-                            try:
-                                setting_data["value"] = float(value)
-                                setting_data["value_raw"] = value
-                                setting_data["type"] = "float"
-                            except ValueError:
-                                if value == "0" or value == "1":
-                                    setting_data["value"] = value == "1"
-                                    setting_data["value_raw"] = value
-                                    setting_data["type"] = "bool"
-                                else:
-                                    setting_data["value"] = value
-                                    setting_data["value_raw"] = value
-                                    setting_data["type"] = "str"
-                elif key == "BIOS Default":
-                    setting_data["default"] = value
-                elif key == "Token":
-                    setting_data["token"] = value
-                elif key == "Offset":
-                    setting_data["offset"] = value
-                elif key == "Width":
-                    setting_data["width"] = value
-                else:
-                    setting_data[key.lower().replace(" ", "_")] = value
+            if key == "Value":
+                # Парсинг значения
+                coerced = self._coerce_value(value)
+                setting_data["value"] = coerced.value
+                setting_data["value_raw"] = coerced.raw
+                setting_data["type"] = coerced.type
+                continue
+            
+            # Известные поля (Token, Offset и т.д.) переименовываются,
+            # прочие (Help String, Options и т.д.) сохраняются как есть
+            field_key = field_keys.get(key)
+            if field_key is None:
+                field_key = _SECTION_FIELDS.get(key) or key.lower().replace(" ", "_")
+                field_keys[key] = field_key
+            setting_data[field_key] = value
         
         # Сохраняем последний параметр
         if current_setting and setting_data:
             settings[current_setting] = setting_data
         
+        categories, reboot_flags, performance_flags = self._classify_names(list(settings))
+        for setting_data, category, requires_reboot, is_performance in zip(
+                settings.values(), categories, reboot_flags, performance_flags):
+            setting_data["category"] = category
+            setting_data["requires_reboot"] = requires_reboot
+            setting_data["is_performance_related"] = is_performance
+        
         logger.info(f"Найдено {len(settings)} параметров BIOS")
         return settings
     
-    def find_power_limit_parameters(self) -> List[str]:
+    def _classify_all(self) -> Dict[str, Any]:
         """
-        Находит параметры, связанные с лимитами мощности CPU.
+        Распределяет все параметры BIOS по группам за один проход.
+        
+        Результат кэшируется до следующего изменения дампа.
         
         Returns:
-            Список названий найденных параметров
+            Словарь {группа_поиска: [список_параметров]}, где ключ "performance"
+            содержит категории для find_all_performance_parameters
         """
         settings = self.parse_all_bios_settings()
-        power_params = []
+        if self._classified is not None:
+            return self._classified
         
-        # Ключевые слова для поиска лимитов мощности
-        power_keywords = [
-            'power limit', 'tdp', 'thermal design power', 'pl1', 'pl2', 
-            'long duration', 'short duration', 'package power', 'ppt', 
-            'tdc', 'edc', 'power target'
-        ]
+        power_params = []
+        voltage_params = []
+        xmp_params = []
+        cstate_params = []
+        turbo_params = []
+        performance_params = {
+            "power": [],
+            "voltage": [],
+            "memory": [],
+            "cpu_features": [],
+            "turbo": [],
+            "cstates": [],
+            "other": []
+        }
         
         for name, data in settings.items():
             name_lower = name.lower()
-            if data.get("is_performance_related") and any(kw in name_lower for kw in power_keywords):
+            is_performance = data.get("is_performance_related")
+            
+            if self._XMP_RE.search(name_lower):
+                xmp_params.append(name)
+            if self._CSTATE_RE.search(name_lower):
+                cstate_params.append(name)
+            
+            if not is_performance:
+                continue
+            
+            # Быстрая проверка подстрок до запуска регулярного выражения:
+            # каждое ключевое слово POWER_LIMIT_KEYWORDS содержит один из этих литералов
+            if ("power" in name_lower or "pl" in name_lower or "tdp" in name_lower or
+                    "ppt" in name_lower or "tdc" in name_lower or "edc" in name_lower or
+                    "duration" in name_lower) and self._POWER_RE.search(name_lower):
                 power_params.append(name)
+            if self._VOLTAGE_RE.search(name_lower):
+                voltage_params.append(name)
+            if self._TURBO_RE.search(name_lower):
+                turbo_params.append(name)
+            
+            # Категоризация параметров (первая подходящая группа)
+            group = _first_matching_group(name_lower, self._GROUP_UNION_RE, self._GROUP_RES)
+            performance_params[group or "other"].append(name)
         
+        self._classified = {
+            "power_limit": power_params,
+            "voltage": voltage_params,
+            "xmp": xmp_params,
+            "cstate": cstate_params,
+            "turbo": turbo_params,
+            "performance": performance_params
+        }
+        return self._classified
+    
+    def find_power_limit_parameters(self) -> List[str]:
+        """
+        Находит параметры, связанные с лимитами мощности CPU.
+        
+        Returns:
+            Список названий найденных параметров
+        """
+        power_params = list(self._classify_all()["power_limit"])
         logger.info(f"Найдены следующие параметры лимитов мощности: {power_params}")
         return power_params
     
@@ -433,19 +985,7 @@ class BiosService:
         Returns:
             Список названий найденных параметров
         """
-        settings = self.parse_all_bios_settings()
-        voltage_params = []
-        
-        # Ключевые слова для поиска настроек напряжения
-        voltage_keywords = [
-            'voltage', 'vcore', 'offset', 'vid', 'core volt'
-        ]
-        
-        for name, data in settings.items():
-            name_lower = name.lower()
-            if data.get("is_performance_related") and any(kw in name_lower for kw in voltage_keywords):
-                voltage_params.append(name)
-        
+        voltage_params = list(self._classify_all()["voltage"])
         logger.info(f"Найдены следующие параметры напряжения: {voltage_params}")
         return voltage_params
     
@@ -456,19 +996,7 @@ class BiosService:
         Returns:
             Список названий найденных параметров
         """
-        settings = self.parse_all_bios_settings()
-        xmp_params = []
-        
-        # Ключевые слова для поиска настроек XMP/DOCP
-        xmp_keywords = [
-            'xmp', 'docp', 'memory profile', 'extreme memory profile'
-        ]
-        
-        for name, data in settings.items():
-            name_lower = name.lower()
-            if any(kw in name_lower for kw in xmp_keywords):
-                xmp_params.append(name)
-        
+        xmp_params = list(self._classify_all()["xmp"])
         logger.info(f"Найдены следующие параметры XMP/DOCP: {xmp_params}")
         return xmp_params
     
@@ -479,19 +1007,7 @@ class BiosService:
         Returns:
             Список названий найденных параметров
         """
-        settings = self.parse_all_bios_settings()
-        cstate_params = []
-        
-        # Ключевые слова для поиска настроек C-States
-        cstate_keywords = [
-            'c-state', 'c state', 'c1e', 'c3', 'c6', 'c7', 'package c state'
-        ]
-        
-        for name, data in settings.items():
-            name_lower = name.lower()
-            if any(kw in name_lower for kw in cstate_keywords):
-                cstate_params.append(name)
-        
+        cstate_params = list(self._classify_all()["cstate"])
         logger.info(f"Найдены следующие параметры C-States: {cstate_params}")
         return cstate_params
     
@@ -502,19 +1018,7 @@ class BiosService:
         Returns:
             Список названий найденных параметров
         """
-        settings = self.parse_all_bios_settings()
-        turbo_params = []
-        
-        # Ключевые слова для поиска настроек Turbo
-        turbo_keywords = [
-            'turbo', 'boost', 'intel turbo', 'precision boost', 'core performance'
-        ]
-        
-        for name, data in settings.items():
-            name_lower = name.lower()
-            if data.get("is_performance_related") and any(kw in name_lower for kw in turbo_keywords):
-                turbo_params.append(name)
-        
+        turbo_params = list(self._classify_all()["turbo"])
         logger.info(f"Найдены следующие параметры Turbo Boost: {turbo_params}")
         return turbo_params
     
@@ -525,41 +1029,8 @@ class BiosService:
         Returns:
             Словарь {категория: [список_параметров]}
         """
-        settings = self.parse_all_bios_settings()
-        performance_params = {
-            "power": [],
-            "voltage": [],
-            "memory": [],
-            "cpu_features": [],
-            "turbo": [],
-            "cstates": [],
-            "other": []
-        }
-        
-        for name, data in settings.items():
-            if not data.get("is_performance_related"):
-                continue
-                
-            category = data.get("category", "").lower()
-            name_lower = name.lower()
-            
-            # Категоризация параметров
-            if any(kw in name_lower for kw in ['power', 'limit', 'tdp', 'pl1', 'pl2', 'ppt']):
-                performance_params["power"].append(name)
-            elif any(kw in name_lower for kw in ['voltage', 'vcore', 'offset', 'vid']):
-                performance_params["voltage"].append(name)
-            elif any(kw in name_lower for kw in ['memory', 'ram', 'xmp', 'docp']):
-                performance_params["memory"].append(name)
-            elif any(kw in name_lower for kw in ['c-state', 'c state', 'c1e', 'c3', 'c6']):
-                performance_params["cstates"].append(name)
-            elif any(kw in name_lower for kw in ['turbo', 'boost']):
-                performance_params["turbo"].append(name)
-            elif any(kw in name_lower for kw in ['smt', 'hyper', 'thread', 'virtualization']):
-                performance_params["cpu_features"].append(name)
-            else:
-                performance_params["other"].append(name)
-        
-        return performance_params
+        performance_params = self._classify_all()["performance"]
+        return {group: list(params) for group, params in performance_params.items()}
     
     def restore_defaults(self) -> bool:
         """
@@ -574,18 +1045,48 @@ class BiosService:
         
         try:
             logger.info("Восстановление настроек BIOS из резервной копии")
-            result = subprocess.run(
+            subprocess.run(
                 [self.tool_path, "/i", "/s", self.backup_file],
-                capture_output=True,
-                text=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 check=True
             )
+            self._invalidate()
             logger.info("Настройки BIOS успешно восстановлены")
             return True
         except Exception as e:
             logger.error(f"Ошибка при восстановлении настроек BIOS: {e}")
             return False
     
+    @classmethod
+    def _classify_names(cls, names: List[str]) -> Tuple[List[str], List[bool], List[bool]]:
+        """
+        Определяет категорию и признаки для списка параметров за один пакетный проход.
+        
+        Результат совпадает с поэлементным вызовом _categorize_parameter,
+        _requires_reboot и _is_performance_related, но имена приводятся
+        к нижнему регистру один раз, а каждый шаблон применяется в одном списковом выражении.
+        
+        Args:
+            names: Названия параметров
+            
+        Returns:
+            Кортеж списков (категории, требует_перезагрузку, влияет_на_производительность)
+        """
+        names_lower = [name.lower() for name in names]
+        union_re = cls._CATEGORY_UNION_RE
+        category_res = cls._CATEGORY_RES
+        
+        categories = [_first_matching_group(name, union_re, category_res) or "other"
+                      for name in names_lower]
+        reboot_search = cls._REBOOT_RE.search
+        reboot_flags = [reboot_search(name) is not None for name in names_lower]
+        perf_search = cls._PERF_RE.search
+        performance_flags = [perf_search(name) is not None for name in names_lower]
+        
+        return categories, reboot_flags, performance_flags
+    
     def _categorize_parameter(self, param_name: str) -> str:
         """
         Определяет категорию параметра BIOS.
@@ -597,13 +1098,10 @@ class BiosService:
             Категория параметра
         """
         param_lower = param_name.lower()
-        
-        for category, keywords in self.PARAM_CATEGORIES.items():
-            if any(kw in param_lower for kw in keywords):
-                return category
+        category = _first_matching_group(param_lower, self._CATEGORY_UNION_RE, self._CATEGORY_RES)
         
         # Если не нашли подходящую категорию
-        return "other"
+        return category or "other"
     
     def _is_performance_related(self, param_name: str) -> bool:
         """
@@ -616,7 +1114,7 @@ class BiosService:
             True, если параметр влияет на производительность, иначе False
         """
         param_lower = param_name.lower()
-        return any(kw in param_lower for kw in self.PERFORMANCE_KEYWORDS)
+        return self._PERF_RE.search(param_lower) is not None
     
     def _requires_reboot(self, param_name: str) -> bool:
         """
@@ -629,4 +1127,4 @@ class BiosService:
             True, если требуется перезагрузка, иначе False
         """
         param_lower = param_name.lower()
-        return any(kw in param_lower for kw in self.REBOOT_REQUIRED_PARAMS)
\ No newline at end of file
+        return self._REBOOT_RE.search(param_lower) is not None
\ No newline at end of file
@@ -4,14 +4,91 @@
 """
 import json
 import os
+import math
 import logging
+import operator
+from array import array
+from collections import deque
 from datetime import datetime
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Any, Optional
-from copy import deepcopy
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Any, Optional, NamedTuple, Set, Deque, Tuple
+
+# orjson (если установлен) сериализует профиль значительно быстрее стандартного json;
+# обе реализации работают с байтами в UTF-8
+try:
+    import orjson
+    
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    
+    _loads = orjson.loads
+except ImportError:
+    # Кодировщик с постоянными настройками создается один раз, а не при каждом вызове
+    _JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+    
+    def _dumps(data: Any) -> bytes:
+        return _JSON_ENCODER.encode(data).encode('utf-8')
+    
+    _loads = json.loads
 
 logger = logging.getLogger("cpu_tuner")
 
+# Каталоги, существование которых уже проверено при сохранении профилей
+_KNOWN_DIRS: Set[str] = set()
+
+# Сколько последних протестированных значений хранится для каждого параметра BIOS
+TESTED_VALUES_LIMIT = 128
+
+# Порядок применения измененных параметров по категориям (BiosService.PARAM_CATEGORIES):
+# напряжение до лимитов мощности и частот, память последней; прочие категории - в конце
+APPLY_ORDER_PRIORITY = {
+    'cpu_voltage': 0,
+    'cpu_power': 1,
+    'cpu_freq': 2,
+    'cpu_features': 3,
+    'memory': 4,
+}
+
+class TestStatistics(NamedTuple):
+    """Сводная статистика производительности по истории тестов"""
+    count: int                       # Количество тестов
+    mean: float                      # Средняя производительность (операций/сек)
+    std: float                       # Стандартное отклонение (операций/сек)
+    best: float                      # Лучшая производительность (операций/сек)
+    best_index: int                  # Индекс лучшего теста в истории
+    mean_perf_diff: float            # Среднее отличие от базового уровня (проценты)
+
+def _aggregate_ops(values: "array", baseline: float) -> TestStatistics:
+    """
+    Считает статистику производительности за один проход по массиву.
+    
+    Args:
+        values: Производительность тестов (операций/сек)
+        baseline: Базовая производительность (0 - если неизвестна)
+        
+    Returns:
+        Статистика производительности
+    """
+    count = len(values)
+    if not count:
+        return TestStatistics(0, 0.0, 0.0, 0.0, -1, 0.0)
+    
+    total = 0.0
+    total_sq = 0.0
+    best = values[0]
+    best_index = 0
+    for i, value in enumerate(values):
+        total += value
+        total_sq += value * value
+        if value > best:
+            best = value
+            best_index = i
+    
+    mean = total / count
+    std = math.sqrt(max(total_sq / count - mean * mean, 0.0))
+    mean_perf_diff = (mean - baseline) / baseline * 100 if baseline > 0 else 0.0
+    return TestStatistics(count, mean, std, best, best_index, mean_perf_diff)
+
 @dataclass
 class BiosParameter:
     """Класс, представляющий отдельный параметр BIOS"""
@@ -19,7 +96,8 @@ class BiosParameter:
     current_value: Any          # Текущее значение
     default_value: Any          # Значение по умолчанию
     modified: bool = False      # Было ли изменено значение
-    tested_values: List[Any] = field(default_factory=list)  # Список протестированных значений
+    tested_values: Deque[Any] = field(  # Последние протестированные значения
+        default_factory=lambda: deque(maxlen=TESTED_VALUES_LIMIT))
     best_value: Any = None      # Лучшее найденное значение
     category: str = ""          # Категория параметра (CPU, память, питание...)
     description: str = ""       # Описание параметра
@@ -29,10 +107,25 @@ class BiosParameter:
     def __post_init__(self):
         if self.best_value is None:
             self.best_value = self.current_value
+        # Список из словаря или JSON-файла превращаем в ограниченную очередь
+        if not isinstance(self.tested_values, deque) or self.tested_values.maxlen != TESTED_VALUES_LIMIT:
+            self.tested_values = deque(self.tested_values, maxlen=TESTED_VALUES_LIMIT)
     
     def as_dict(self):
         """Преобразует параметр в словарь для сериализации"""
-        return asdict(self)
+        # Словарь собирается явно: asdict рекурсивно копирует каждое поле через deepcopy
+        return {
+            "name": self.name,
+            "current_value": self.current_value,
+            "default_value": self.default_value,
+            "modified": self.modified,
+            "tested_values": list(self.tested_values),
+            "best_value": self.best_value,
+            "category": self.category,
+            "description": self.description,
+            "impact": self.impact,
+            "stability_impact": self.stability_impact
+        }
     
     @classmethod
     def from_dict(cls, data):
@@ -53,7 +146,16 @@ class StressTestResult:
     
     def as_dict(self):
         """Преобразует результаты теста в словарь для сериализации"""
-        return asdict(self)
+        return {
+            "operations_per_second": self.operations_per_second,
+            "max_temperature": self.max_temperature,
+            "avg_temperature": self.avg_temperature,
+            "max_power": self.max_power,
+            "avg_power": self.avg_power,
+            "test_duration": self.test_duration,
+            "cpu_frequency": self.cpu_frequency,
+            "completed": self.completed
+        }
     
     @classmethod
     def from_dict(cls, data):
@@ -93,6 +195,60 @@ class CPUProfile:
     baseline_results: Optional[StressTestResult] = None
     best_results: Optional[StressTestResult] = None
     
+    def __post_init__(self):
+        # Имена измененных параметров (dict как упорядоченное множество в порядке
+        # регистрации), чтобы get_modified_parameters не перебирал все параметры BIOS
+        self._modified_names: Dict[str, None] = {}
+        self._ordered_names: Optional[Tuple[str, ...]] = None
+        self._sync_modified_names()
+        
+        # Кэш сериализованных параметров BIOS; параметры, измененные методами профиля
+        # после последней сериализации, помечаются в _dirty_params и сериализуются заново
+        self._serialized_params: Dict[str, Dict[str, Any]] = {}
+        self._dirty_params: Set[str] = set()
+        
+        # Производительность тестов из test_history в виде плотного массива чисел
+        self._ops_values = array('d')
+        self._sync_ops_values()
+        
+        # Последняя посчитанная статистика и ключ (длина истории, базовый уровень),
+        # для которого она действительна
+        self._stats_key: Optional[tuple] = None
+        self._stats: Optional[TestStatistics] = None
+        
+        # Последний результат _to_json_bytes и данные, из которых он получен
+        # (повторное сохранение неизмененного профиля обходится без сериализации)
+        self._json_cache: Optional[tuple] = None
+    
+    def _sync_modified_names(self):
+        """Пересобирает множество имен измененных параметров по bios_parameters"""
+        self._modified_names = dict.fromkeys(
+            name for name, param in self.bios_parameters.items() if param.modified)
+        self._ordered_names = None
+    
+    def _sync_ops_values(self):
+        """Пересобирает массив производительности по test_history"""
+        self._ops_values = array('d', (entry.get("result", {}).get("operations_per_second", 0.0)
+                                       for entry in self.test_history))
+        self._stats_key = None
+    
+    def get_test_statistics(self) -> TestStatistics:
+        """
+        Возвращает сводную статистику производительности по истории тестов.
+        
+        Returns:
+            Статистика производительности
+        """
+        baseline = self.baseline_results.operations_per_second if self.baseline_results else 0.0
+        
+        # История только дополняется (или пересобирается целиком со сбросом ключа),
+        # поэтому повторные вызовы без новых тестов возвращают готовый результат
+        key = (len(self._ops_values), baseline)
+        if key != self._stats_key:
+            self._stats = _aggregate_ops(self._ops_values, baseline)
+            self._stats_key = key
+        return self._stats
+    
     def add_test_result(self, parameter_name: str, parameter_value: Any, test_result: StressTestResult):
         """
         Добавляет результат теста в историю.
@@ -110,11 +266,13 @@ class CPUProfile:
             "perf_diff_percent": self._calculate_perf_diff(test_result.operations_per_second)
         }
         self.test_history.append(test_entry)
+        self._ops_values.append(test_result.operations_per_second)
         
         # Если это параметр BIOS, обновляем его данные
         if parameter_name in self.bios_parameters:
             param = self.bios_parameters[parameter_name]
             param.tested_values.append(parameter_value)
+            self._dirty_params.add(parameter_name)
             
             # Если результат лучше предыдущего лучшего результата
             if (test_result.completed and 
@@ -124,6 +282,16 @@ class CPUProfile:
                 self.best_results = test_result
                 logger.info(f"Новое лучшее значение для {parameter_name}: {parameter_value}")
     
+    def _recompute_history_perf_diffs(self):
+        """Пересчитывает perf_diff_percent всех записей истории одним проходом по _ops_values"""
+        baseline = self.baseline_results.operations_per_second if self.baseline_results else 0.0
+        if baseline <= 0:
+            return
+        
+        scale = 100.0 / baseline
+        for entry, ops in zip(self.test_history, self._ops_values):
+            entry["perf_diff_percent"] = (ops - baseline) * scale
+    
     def _calculate_perf_diff(self, new_perf: float) -> float:
         """
         Вычисляет процентную разницу в производительности относительно базового уровня.
@@ -169,6 +337,7 @@ class CPUProfile:
             self.bios_parameters[name].current_value = current_value
             if default_value != current_value:
                 self.bios_parameters[name].default_value = default_value
+            self._dirty_params.add(name)
     
     def update_parameter(self, name: str, new_value: Any, mark_as_modified: bool = True):
         """
@@ -182,12 +351,29 @@ class CPUProfile:
         if name in self.bios_parameters:
             old_value = self.bios_parameters[name].current_value
             self.bios_parameters[name].current_value = new_value
+            self._dirty_params.add(name)
             if mark_as_modified:
                 self.bios_parameters[name].modified = True
+                if name not in self._modified_names:
+                    self._sync_modified_names()
             logger.info(f"Обновлен параметр BIOS: {name} = {new_value} (было: {old_value})")
         else:
             logger.warning(f"Попытка обновить несуществующий параметр: {name}")
     
+    def set_best_value(self, name: str, best_value: Any):
+        """
+        Устанавливает лучшее найденное значение параметра BIOS.
+        
+        Args:
+            name: Название параметра
+            best_value: Лучшее значение
+        """
+        if name in self.bios_parameters:
+            self.bios_parameters[name].best_value = best_value
+            self._dirty_params.add(name)
+        else:
+            logger.warning(f"Попытка обновить несуществующий параметр: {name}")
+    
     def get_modified_parameters(self) -> Dict[str, Any]:
         """
         Возвращает словарь измененных параметров.
@@ -195,18 +381,48 @@ class CPUProfile:
         Returns:
             Словарь {имя_параметра: текущее_значение} для всех измененных параметров
         """
-        return {name: param.current_value 
-                for name, param in self.bios_parameters.items() 
-                if param.modified}
+        return {name: self.bios_parameters[name].current_value
+                for name in self._modified_names}
+    
+    def get_ordered_modified_parameters(self) -> Tuple[Tuple[str, Any], ...]:
+        """
+        Возвращает измененные параметры в порядке применения к BIOS.
+        
+        Порядок имен (по APPLY_ORDER_PRIORITY, внутри категории - порядок регистрации)
+        вычисляется один раз и пересчитывается только при изменении набора
+        измененных параметров.
+        
+        Returns:
+            Кортеж пар (имя_параметра, текущее_значение)
+        """
+        if self._ordered_names is None:
+            last = len(APPLY_ORDER_PRIORITY)
+            self._ordered_names = tuple(sorted(
+                self._modified_names,
+                key=lambda name: APPLY_ORDER_PRIORITY.get(self.bios_parameters[name].category, last)))
+        params = self.bios_parameters
+        return tuple((name, params[name].current_value) for name in self._ordered_names)
     
     def clone(self):
         """
         Создает копию профиля для экспериментов.
         
+        Коллекции пересобираются явно вместо deepcopy: параметры BIOS и результаты
+        тестов копируются через dataclasses.replace, записи истории тестов - поверхностно
+        (после добавления в историю они не изменяются).
+        
         Returns:
             Новый экземпляр CPUProfile с копированием всех данных
         """
-        return deepcopy(self)
+        return replace(
+            self,
+            bios_parameters={name: replace(param, tested_values=deque(param.tested_values,
+                                                                     maxlen=TESTED_VALUES_LIMIT))
+                             for name, param in self.bios_parameters.items()},
+            test_history=[dict(entry) for entry in self.test_history],
+            baseline_results=replace(self.baseline_results) if self.baseline_results else None,
+            best_results=replace(self.best_results) if self.best_results else None
+        )
     
     def to_json(self):
         """
@@ -215,7 +431,41 @@ class CPUProfile:
         Returns:
             JSON-строка с данными профиля
         """
-        data = {
+        return self._to_json_bytes().decode('utf-8')
+    
+    def _serialize_parameters(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Сериализует параметры BIOS, повторно используя словари неизмененных параметров.
+        
+        Returns:
+            Словарь {имя_параметра: словарь_параметра}
+        """
+        cache = self._serialized_params
+        for name in self._dirty_params:
+            cache.pop(name, None)
+        self._dirty_params.clear()
+        
+        result = {}
+        for name, param in self.bios_parameters.items():
+            data = cache.get(name)
+            if data is None:
+                data = cache[name] = param.as_dict()
+            result[name] = data
+        return result
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Собирает словарь для сериализации профиля.
+        
+        Вложенные словари параметров кэшируются профилем, поэтому результат
+        предназначен только для немедленной сериализации и не должен изменяться.
+        
+        Returns:
+            Словарь с данными профиля
+        """
+        # Набор полей профиля фиксирован, поэтому словарь собирается литералом,
+        # без обхода полей dataclass
+        return {
             "power_limit1": self.power_limit1,
             "power_limit2": self.power_limit2,
             "voltage_offset": self.voltage_offset,
@@ -228,15 +478,47 @@ class CPUProfile:
             "is_stable": self.is_stable,
             "requires_reboot": self.requires_reboot,
             
-            "bios_parameters": {name: param.as_dict() 
-                               for name, param in self.bios_parameters.items()},
+            "bios_parameters": self._serialize_parameters(),
             
             "test_history": self.test_history,
             
             "baseline_results": self.baseline_results.as_dict() if self.baseline_results else None,
             "best_results": self.best_results.as_dict() if self.best_results else None
         }
-        return json.dumps(data, indent=2)
+    
+    def _to_json_bytes(self) -> bytes:
+        """
+        Сериализует профиль в JSON (UTF-8).
+        
+        Returns:
+            JSON-представление профиля в байтах
+        """
+        data = self.as_dict()
+        
+        # Поля профиля и результаты тестов (небольшие, собираются заново) сравниваются
+        # по значению. Словари параметров берутся из кэша _serialize_parameters и
+        # заменяются при изменении параметра, а записи истории после добавления
+        # не изменяются (кроме пересчета при смене базового результата, который входит
+        # в поля) - их достаточно сравнить по идентичности
+        params = data["bios_parameters"]
+        fields = tuple(value for key, value in data.items()
+                       if key != "bios_parameters" and key != "test_history")
+        names = tuple(params)
+        param_dicts = tuple(params.values())
+        history = tuple(data["test_history"])
+        
+        cached = self._json_cache
+        if cached is not None:
+            cached_fields, cached_names, cached_params, cached_history, result = cached
+            if (cached_fields == fields and cached_names == names
+                    and len(cached_history) == len(history)
+                    and all(map(operator.is_, cached_params, param_dicts))
+                    and all(map(operator.is_, cached_history, history))):
+                return result
+        
+        result = _dumps(data)
+        self._json_cache = (fields, names, param_dicts, history, result)
+        return result
     
     @classmethod
     def from_json(cls, json_str):
@@ -244,12 +526,24 @@ class CPUProfile:
         Создает профиль из JSON-строки.
         
         Args:
-            json_str: JSON-строка с данными профиля
+            json_str: JSON-строка (или байты в UTF-8) с данными профиля
+            
+        Returns:
+            Новый экземпляр CPUProfile
+        """
+        return cls.from_dict(_loads(json_str))
+    
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Создает профиль из словаря (разобранного JSON).
+        
+        Args:
+            data: Словарь с данными профиля
             
         Returns:
             Новый экземпляр CPUProfile
         """
-        data = json.loads(json_str)
         profile = cls(
             power_limit1=data.get("power_limit1", 0),
             power_limit2=data.get("power_limit2", 0),
@@ -267,15 +561,18 @@ class CPUProfile:
         # Загрузка параметров BIOS
         for name, param_data in data.get("bios_parameters", {}).items():
             profile.bios_parameters[name] = BiosParameter.from_dict(param_data)
+        profile._sync_modified_names()
             
         # Загрузка истории тестов
         profile.test_history = data.get("test_history", [])
+        profile._sync_ops_values()
         
         # Загрузка результатов тестов
         if data.get("baseline_results"):
             profile.baseline_results = StressTestResult.from_dict(data["baseline_results"])
         if data.get("best_results"):
             profile.best_results = StressTestResult.from_dict(data["best_results"])
+        profile._recompute_history_perf_diffs()
             
         return profile
     
@@ -285,14 +582,36 @@ class CPUProfile:
         
         Args:
             filename: Путь к файлу для сохранения
+            
+        Raises:
+            OSError: Если записать файл не удалось
+            TypeError, ValueError: Если профиль не удалось сериализовать в JSON
+            
+        При любой ошибке прежний файл остается без изменений.
         """
+        tmp_filename = filename + '.tmp'
         try:
-            os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(self.to_json())
+            directory = os.path.dirname(os.path.abspath(filename))
+            if directory not in _KNOWN_DIRS:
+                os.makedirs(directory, exist_ok=True)
+                _KNOWN_DIRS.add(directory)
+            
+            # Запись во временный файл с атомарной заменой: при сбое во время записи
+            # прежняя версия профиля остается целой. fsync до замены гарантирует, что
+            # после сбоя питания под именем профиля не окажется пустой файл
+            with open(tmp_filename, 'wb') as f:
+                f.write(self._to_json_bytes())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_filename, filename)
             logger.info(f"Профиль сохранен в {filename}")
         except Exception as e:
             logger.error(f"Ошибка при сохранении профиля: {e}")
+            try:
+                os.remove(tmp_filename)
+            except OSError:
+                pass
+            raise
     
     @classmethod
     def load_from_file(cls, filename):
@@ -306,7 +625,7 @@ class CPUProfile:
             Новый экземпляр CPUProfile
         """
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
+            with open(filename, 'rb') as f:
                 return cls.from_json(f.read())
         except Exception as e:
             logger.error(f"Ошибка при загрузке профиля: {e}")
@@ -334,26 +653,33 @@ class CPUProfile:
             f"== Результаты производительности =="
         ]
         
-        if self.baseline_results:
-            report.append(f"Базовая производительность: {self.baseline_results.operations_per_second:.0f} оп/сек")
-            report.append(f"Базовая температура: {self.baseline_results.max_temperature:.1f}°C")
+        baseline = self.baseline_results
+        best = self.best_results
         
-        if self.best_results:
-            report.append(f"Лучшая производительность: {self.best_results.operations_per_second:.0f} оп/сек")
-            report.append(f"Температура при лучшей производительности: {self.best_results.max_temperature:.1f}°C")
+        if baseline:
+            report.append(f"Базовая производительность: {baseline.operations_per_second:.0f} оп/сек")
+            report.append(f"Базовая температура: {baseline.max_temperature:.1f}°C")
+        
+        if best:
+            best_ops = best.operations_per_second
+            report.append(f"Лучшая производительность: {best_ops:.0f} оп/сек")
+            report.append(f"Температура при лучшей производительности: {best.max_temperature:.1f}°C")
             
             # Рассчитываем улучшение
-            if self.baseline_results:
-                perf_improvement = ((self.best_results.operations_per_second - 
-                                    self.baseline_results.operations_per_sec) / 
-                                   self.baseline_results.operations_per_sec * 100)
+            if baseline:
+                baseline_ops = baseline.operations_per_second
+                perf_improvement = (best_ops - baseline_ops) / baseline_ops * 100.0 if baseline_ops else 0.0
                 report.append(f"Прирост производительности: {perf_improvement:.1f}%")
+        
+        stats = self.get_test_statistics()
+        if stats.count:
+            report.append(f"Выполнено тестов: {stats.count}, средняя производительность: "
+                          f"{stats.mean:.0f} ± {stats.std:.0f} оп/сек")
                 
         report.append("")
         report.append("== Измененные параметры BIOS ==")
         
-        modified_params = [(name, param) for name, param in self.bios_parameters.items() 
-                         if param.modified]
+        modified_params = [(name, self.bios_parameters[name]) for name in self._modified_names]
         
         if modified_params:
             for name, param in modified_params:
@@ -9,6 +9,8 @@ import os
 import json
 import re
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Tuple, List, Optional, Union, Any
 import wmi
 import pythoncom
@@ -17,6 +19,21 @@ import cpuinfo
 
 logger = logging.getLogger("cpu_tuner")
 
+# TDP в названии CPU (например, "65W")
+_TDP_RE = re.compile(r'(\d+)[WT]')
+
+# Типичный TDP по семейству CPU, если он не указан в названии (проверяются по порядку)
+_TDP_TABLE = (
+    ('i9', 125), ('i7', 95), ('i5', 65), ('i3', 45),
+    ('ryzen 9', 105), ('ryzen 7', 95), ('ryzen 5', 65), ('ryzen 3', 45)
+)
+
+# TDP по умолчанию - среднее значение для большинства десктопных CPU
+_DEFAULT_TDP = 65
+
+# Время (сек), в течение которого повторно используются прочитанные частоты и память
+INFO_CACHE_TTL = 0.25
+
 class HardwareMonitorService:
     """
     Сервис для мониторинга аппаратных параметров системы.
@@ -27,6 +44,14 @@ class HardwareMonitorService:
         """Инициализация сервиса мониторинга"""
         logger.info("Инициализация HardwareMonitorService")
         
+        # cpuinfo.get_cpu_info() запускает подпроцесс и может занимать секунды; COM он
+        # не использует, поэтому выполняется в фоне, пока идет инициализация WMI.
+        # Результат ожидается при первом обращении к cpu_info или estimated_tdp
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cpuinfo")
+        self._cpuinfo_future = executor.submit(cpuinfo.get_cpu_info)
+        executor.shutdown(wait=False)
+        self._cpu_info: Optional[Dict[str, Any]] = None
+        
         # Инициализация WMI (необходимо вызывать в том же потоке, где будет использоваться)
         pythoncom.CoInitialize()
         
@@ -44,12 +69,29 @@ class HardwareMonitorService:
             self.temp_sensors = []
         
         # Пытаемся получить доступ к OpenHardwareMonitor, если он запущен
+        self._ohm_temp_sensor = None
+        self._ohm_power_sensor = None
+        
+        # Последние значения датчиков OHM {Identifier: значение}, которые фоновый поток
+        # получает из событий изменения WMI (пока поток работает, опрос COM не нужен)
+        self._ohm_latest: Dict[str, float] = {}
+        self._ohm_lock = threading.Lock()
+        self._ohm_stop = threading.Event()
+        self._ohm_watch_active = False
+        self._ohm_thread: Optional[threading.Thread] = None
+        self._ohm_temp_id: Optional[str] = None
+        self._ohm_power_id: Optional[str] = None
+        # Датчики WMI потоков, подключенных через attach_thread
+        self._thread_local = threading.local()
         try:
             self.ohm = wmi.WMI(namespace="root\\OpenHardwareMonitor")
             sensors = self.ohm.Sensor()
             if sensors:
                 logger.info(f"OpenHardwareMonitor доступен. Найдено {len(sensors)} датчиков")
                 self.has_ohm = True
+                # Датчики CPU находим один раз, при опросе только обновляем их значения
+                self._ohm_temp_sensor, self._ohm_power_sensor = self._find_ohm_cpu_sensors(sensors)
+                self._start_ohm_watcher()
             else:
                 logger.warning("OpenHardwareMonitor запущен, но датчики не найдены")
                 self.has_ohm = False
@@ -57,18 +99,27 @@ class HardwareMonitorService:
             logger.warning(f"OpenHardwareMonitor недоступен: {e}")
             self.has_ohm = False
         
-        # Инициализация информации о CPU
-        self.cpu_info = self._get_cpu_info()
-        logger.info(f"CPU: {self.cpu_info.get('brand_raw', 'Unknown')}")
+        # Информация о CPU из WMI запрашивается здесь: COM-объекты привязаны к этому потоку
+        self._wmi_cpu_info = self._get_wmi_cpu_info()
         
         # Кэширование данных, доступных из psutil
         self.psutil_has_sensors = hasattr(psutil, 'sensors_temperatures')
+        # Источник и индекс датчика psutil, давшего температуру при последнем полном поиске
+        self._psutil_source: Optional[Tuple[str, int]] = None
         if self.psutil_has_sensors:
             logger.info("psutil поддерживает датчики температуры")
             # Проверяем, какие датчики доступны
             temps = psutil.sensors_temperatures()
             logger.info(f"Доступные датчики через psutil: {list(temps.keys())}")
         
+        # Первый вызов cpu_percent без интервала только запоминает счетчики;
+        # дальнейшие вызовы сразу возвращают загрузку с момента предыдущего вызова
+        psutil.cpu_percent(interval=None)
+        
+        # Кэш частот CPU и использования памяти: (время чтения, значение)
+        self._freq_cache: Tuple[float, Optional[Dict[str, float]]] = (0.0, None)
+        self._memory_cache: Tuple[float, Optional[Dict[str, float]]] = (0.0, None)
+        
         # Для отслеживания максимальных значений в течение сеанса
         self.max_temp_session = 0.0
         self.max_power_session = 0.0
@@ -78,6 +129,242 @@ class HardwareMonitorService:
         test_data = self.read_cpu_data()
         logger.info(f"Тестовое чтение данных: temp={test_data[0]:.1f}°C, power={test_data[1]:.1f}W, load={test_data[2]:.1f}%")
     
+    @staticmethod
+    def _find_ohm_cpu_sensors(sensors) -> Tuple[Any, Any]:
+        """
+        Находит датчики температуры и мощности CPU среди датчиков OpenHardwareMonitor.
+        
+        Args:
+            sensors: Список датчиков OHM
+            
+        Returns:
+            Кортеж (датчик температуры, датчик мощности); None, если датчик не найден
+        """
+        temp_sensor = None
+        fallback_temp_sensor = None
+        power_sensor = None
+        
+        for sensor in sensors:
+            if "CPU" not in sensor.Name:
+                continue
+            if sensor.SensorType == "Temperature":
+                # Предпочитаем CPU Package, иначе первый датчик CPU
+                if "Package" in sensor.Name:
+                    temp_sensor = temp_sensor or sensor
+                else:
+                    fallback_temp_sensor = fallback_temp_sensor or sensor
+            elif sensor.SensorType == "Power" and "Package" in sensor.Name:
+                power_sensor = power_sensor or sensor
+        
+        temp_sensor = temp_sensor or fallback_temp_sensor
+        if temp_sensor is not None:
+            logger.info(f"Датчик температуры OHM: {temp_sensor.Name}")
+        if power_sensor is not None:
+            logger.info(f"Датчик мощности OHM: {power_sensor.Name}")
+        return temp_sensor, power_sensor
+    
+    def _start_ohm_watcher(self) -> None:
+        """
+        Запускает фоновый поток, получающий изменения значений датчиков CPU от OHM.
+        
+        Начальные значения берутся из уже прочитанных датчиков, далее поток
+        обновляет их по событиям __InstanceModificationEvent.
+        """
+        sensors = [s for s in (self._ohm_temp_sensor, self._ohm_power_sensor) if s is not None]
+        if not sensors:
+            return
+        
+        try:
+            if self._ohm_temp_sensor is not None:
+                self._ohm_temp_id = str(self._ohm_temp_sensor.Identifier)
+            if self._ohm_power_sensor is not None:
+                self._ohm_power_id = str(self._ohm_power_sensor.Identifier)
+            identifiers = [i for i in (self._ohm_temp_id, self._ohm_power_id) if i is not None]
+            with self._ohm_lock:
+                for sensor, identifier in zip(sensors, identifiers):
+                    self._ohm_latest[identifier] = float(sensor.Value)
+        except Exception as e:
+            logger.warning(f"Не удалось подготовить отслеживание датчиков OHM: {e}")
+            return
+        
+        conditions = " OR ".join(f"TargetInstance.Identifier = '{identifier}'" for identifier in identifiers)
+        wql = ("SELECT * FROM __InstanceModificationEvent WITHIN 0.5 "
+               f"WHERE TargetInstance ISA 'Sensor' AND ({conditions})")
+        
+        self._ohm_watch_active = True
+        self._ohm_thread = threading.Thread(target=self._ohm_watch_loop, args=(wql,),
+                                            name="ohm-watcher", daemon=True)
+        self._ohm_thread.start()
+    
+    def _ohm_watch_loop(self, wql: str) -> None:
+        """
+        Цикл фонового потока: ожидает события изменения датчиков OHM.
+        
+        Args:
+            wql: WQL-запрос событий
+        """
+        # COM-объекты привязаны к потоку, поэтому подключение к WMI создается здесь
+        pythoncom.CoInitialize()
+        try:
+            watcher = wmi.WMI(namespace="root\\OpenHardwareMonitor").watch_for(raw_wql=wql)
+            while not self._ohm_stop.is_set():
+                try:
+                    event = watcher(timeout_ms=1000)
+                except wmi.x_wmi_timed_out:
+                    continue
+                with self._ohm_lock:
+                    self._ohm_latest[str(event.Identifier)] = float(event.Value)
+        except Exception as e:
+            logger.warning(f"Отслеживание датчиков OHM остановлено, используется опрос: {e}")
+        finally:
+            self._ohm_watch_active = False
+            pythoncom.CoUninitialize()
+    
+    def attach_thread(self) -> None:
+        """
+        Подготавливает текущий поток к чтению датчиков через read_cpu_data.
+        
+        COM-объекты WMI привязаны к потоку, в котором созданы, поэтому поток получает
+        собственные подключения к OHM и ACPI. Датчики OHM находятся по Identifier,
+        запомненным при инициализации. После работы нужно вызвать detach_thread.
+        """
+        pythoncom.CoInitialize()
+        local = self._thread_local
+        local.ohm_temp_sensor = None
+        local.ohm_power_sensor = None
+        local.temp_sensors = []
+        
+        if self.has_ohm:
+            try:
+                ohm = wmi.WMI(namespace="root\\OpenHardwareMonitor")
+                if self._ohm_temp_id is not None:
+                    local.ohm_temp_sensor = next(iter(ohm.Sensor(Identifier=self._ohm_temp_id)), None)
+                if self._ohm_power_id is not None:
+                    local.ohm_power_sensor = next(iter(ohm.Sensor(Identifier=self._ohm_power_id)), None)
+            except Exception as e:
+                logger.warning(f"Не удалось подключиться к OpenHardwareMonitor из потока: {e}")
+        
+        if self.temp_sensors:
+            try:
+                local.temp_sensors = wmi.WMI(namespace="root\\wmi").MSAcpi_ThermalZoneTemperature()
+            except Exception as e:
+                logger.warning(f"Не удалось подключиться к ACPI датчикам из потока: {e}")
+        
+        local.attached = True
+    
+    def detach_thread(self) -> None:
+        """Освобождает подключения WMI, созданные attach_thread в текущем потоке"""
+        local = self._thread_local
+        local.attached = False
+        # COM-объекты освобождаются до CoUninitialize
+        local.ohm_temp_sensor = None
+        local.ohm_power_sensor = None
+        local.temp_sensors = []
+        pythoncom.CoUninitialize()
+    
+    def _thread_sensors(self) -> Tuple[Any, Any, list]:
+        """
+        Возвращает WMI-объекты датчиков для текущего потока.
+        
+        Returns:
+            Кортеж (датчик температуры OHM, датчик мощности OHM, датчики ACPI):
+            собственные объекты потока после attach_thread, иначе созданные при инициализации
+        """
+        local = self._thread_local
+        if getattr(local, 'attached', False):
+            return local.ohm_temp_sensor, local.ohm_power_sensor, local.temp_sensors
+        return self._ohm_temp_sensor, self._ohm_power_sensor, self.temp_sensors
+    
+    def _read_ohm_sensor(self, sensor, identifier: Optional[str]) -> float:
+        """
+        Возвращает текущее значение датчика OHM.
+        
+        Пока работает фоновый поток событий, значение берется из его словаря;
+        иначе закэшированный WMI-объект датчика перечитывается.
+        
+        Args:
+            sensor: WMI-объект датчика
+            identifier: Identifier датчика в OHM (None, если не отслеживается)
+            
+        Returns:
+            Значение датчика
+        """
+        if self._ohm_watch_active and identifier is not None:
+            with self._ohm_lock:
+                value = self._ohm_latest.get(identifier)
+            if value is not None:
+                return value
+        
+        self._refresh_sensor(sensor)
+        return float(sensor.Value)
+    
+    @staticmethod
+    def _refresh_sensor(sensor) -> None:
+        """
+        Перечитывает свойства закэшированного WMI-объекта датчика.
+        
+        Объекты WMI - это снимки на момент запроса, поэтому перед чтением
+        значения их нужно обновить (одно чтение экземпляра вместо нового запроса).
+        
+        Args:
+            sensor: WMI-объект датчика
+        """
+        sensor.ole_object.Refresh_()
+    
+    @property
+    def cpu_info(self) -> Dict[str, Any]:
+        """Подробная информация о CPU (при первом обращении ожидает фоновый cpuinfo)"""
+        if self._cpu_info is None:
+            self._resolve_cpu_info()
+        return self._cpu_info
+    
+    @property
+    def estimated_tdp(self) -> int:
+        """Оценка TDP для расчета мощности, если датчик мощности недоступен"""
+        if self._cpu_info is None:
+            self._resolve_cpu_info()
+        return self._estimated_tdp
+    
+    def _resolve_cpu_info(self):
+        """Получает информацию о CPU и вычисляет зависящие от нее оценки"""
+        info = self._get_cpu_info()
+        cpu_name = info.get('brand_raw', '')
+        logger.info(f"CPU: {cpu_name or 'Unknown'}")
+        self._cpu_name_lower = cpu_name.lower()
+        
+        # Семейство CPU из таблицы TDP (пустая строка, если TDP взят из названия или по умолчанию)
+        self._tdp_tier = ""
+        self._estimated_tdp = self._derive_tdp(cpu_name)
+        # Оценочная мощность на 1% загрузки (TDP с коэффициентом эффективности 0.8)
+        self._power_per_load = self._estimated_tdp * 0.008
+        
+        # Присваивается последним: по нему другие потоки определяют, что оценки готовы
+        self._cpu_info = info
+    
+    def _derive_tdp(self, cpu_name: str) -> int:
+        """
+        Оценивает TDP процессора по его названию.
+        
+        Args:
+            cpu_name: Название процессора
+            
+        Returns:
+            TDP в ваттах
+        """
+        # Для Intel TDP обычно указан в названии, например для Core i7-8700K TDP = 95W
+        tdp_match = _TDP_RE.search(cpu_name)
+        if tdp_match:
+            tdp = int(tdp_match.group(1))
+        else:
+            # Если TDP не найден в названии, используем типичные значения
+            self._tdp_tier, tdp = next(
+                ((family, family_tdp) for family, family_tdp in _TDP_TABLE
+                 if family in self._cpu_name_lower),
+                ("", _DEFAULT_TDP))
+        
+        logger.info(f"Оценка TDP: {tdp}W для {cpu_name}")
+        return tdp
+    
     def _get_cpu_info(self) -> Dict[str, str]:
         """
         Получает подробную информацию о CPU.
@@ -86,7 +373,7 @@ class HardwareMonitorService:
             Словарь с информацией о CPU
         """
         try:
-            info = cpuinfo.get_cpu_info()
+            info = self._cpuinfo_future.result()
             
             # Определяем, Intel или AMD
             brand = info.get('brand_raw', '').lower()
@@ -97,27 +384,13 @@ class HardwareMonitorService:
             else:
                 cpu_type = 'unknown'
                 
-            # Дополнительно получаем информацию из WMI
-            wmi_cpu_info = {}
-            try:
-                cpu_wmi = self.base_wmi.Win32_Processor()[0]
-                wmi_cpu_info = {
-                    'name': cpu_wmi.Name,
-                    'socket': cpu_wmi.SocketDesignation,
-                    'manufacturer': cpu_wmi.Manufacturer,
-                    'current_clock': cpu_wmi.CurrentClockSpeed,
-                    'max_clock': cpu_wmi.MaxClockSpeed
-                }
-            except Exception as e:
-                logger.warning(f"Не удалось получить CPU информацию через WMI: {e}")
-            
-            # Объединяем информацию
+            # Объединяем информацию (с данными WMI, полученными при инициализации)
             result = {
                 **info,
                 'type': cpu_type,
                 'core_count': psutil.cpu_count(logical=False),
                 'thread_count': psutil.cpu_count(logical=True),
-                **wmi_cpu_info
+                **self._wmi_cpu_info
             }
             
             return result
@@ -125,6 +398,26 @@ class HardwareMonitorService:
             logger.error(f"Ошибка при получении информации о CPU: {e}")
             return {'brand_raw': 'Unknown CPU', 'type': 'unknown'}
     
+    def _get_wmi_cpu_info(self) -> Dict[str, Any]:
+        """
+        Получает информацию о CPU через WMI.
+        
+        Returns:
+            Словарь с информацией о CPU (пустой, если WMI недоступен)
+        """
+        try:
+            cpu_wmi = self.base_wmi.Win32_Processor()[0]
+            return {
+                'name': cpu_wmi.Name,
+                'socket': cpu_wmi.SocketDesignation,
+                'manufacturer': cpu_wmi.Manufacturer,
+                'current_clock': cpu_wmi.CurrentClockSpeed,
+                'max_clock': cpu_wmi.MaxClockSpeed
+            }
+        except Exception as e:
+            logger.warning(f"Не удалось получить CPU информацию через WMI: {e}")
+            return {}
+    
     def read_cpu_data(self) -> Tuple[float, float, float]:
         """
         Считывает текущие данные о CPU: температуру (°C), мощность (Вт) и нагрузку (%).
@@ -132,8 +425,13 @@ class HardwareMonitorService:
         Returns:
             Кортеж (температура, мощность, нагрузка)
         """
-        # Получение загрузки CPU
-        load = psutil.cpu_percent(interval=0.2)
+        # Отладочные сообщения форматируются (и читают свойства COM-объектов),
+        # только если уровень DEBUG действительно включен
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
+        # Получение загрузки CPU с момента предыдущего чтения (без ожидания:
+        # частоту опроса задает вызывающий код)
+        load = psutil.cpu_percent(interval=None)
         
         # Инициализация значений
         temp = 0.0
@@ -141,36 +439,25 @@ class HardwareMonitorService:
         
         # Попытки получить температуру из разных источников
         temp_sources_tried = []
+        ohm_temp_sensor, ohm_power_sensor, acpi_sensors = self._thread_sensors()
         
         # 1. Попытка использовать OpenHardwareMonitor (если доступен)
         if self.has_ohm:
             try:
-                # Обновляем список сенсоров перед чтением
-                cpu_temps = self.ohm.Sensor(["Temperature"])
                 temp_sources_tried.append("OpenHardwareMonitor")
                 
-                # Ищем CPU package сенсор
-                for sensor in cpu_temps:
-                    if "CPU" in sensor.Name and "Package" in sensor.Name:
-                        temp = float(sensor.Value)
+                # Читаем значения закэшированных датчиков CPU (без повторного запроса WMI)
+                sensor = ohm_temp_sensor
+                if sensor is not None:
+                    temp = self._read_ohm_sensor(sensor, self._ohm_temp_id)
+                    if debug:
                         logger.debug(f"Температура из OHM: {temp}°C (сенсор: {sensor.Name})")
-                        break
                 
-                # Если не нашли Package, попробуем любой CPU сенсор
-                if temp == 0.0:
-                    for sensor in cpu_temps:
-                        if "CPU" in sensor.Name:
-                            temp = float(sensor.Value)
-                            logger.debug(f"Температура из OHM (alternative): {temp}°C (сенсор: {sensor.Name})")
-                            break
-                
-                # Попытка получить мощность CPU
-                cpu_powers = self.ohm.Sensor(["Power"])
-                for sensor in cpu_powers:
-                    if "CPU" in sensor.Name and "Package" in sensor.Name:
-                        power = float(sensor.Value)
+                sensor = ohm_power_sensor
+                if sensor is not None:
+                    power = self._read_ohm_sensor(sensor, self._ohm_power_id)
+                    if debug:
                         logger.debug(f"Мощность из OHM: {power}W (сенсор: {sensor.Name})")
-                        break
             except Exception as e:
                 logger.debug(f"Ошибка при чтении данных из OpenHardwareMonitor: {e}")
         
@@ -180,36 +467,34 @@ class HardwareMonitorService:
                 temp_sources_tried.append("psutil")
                 temps = psutil.sensors_temperatures()
                 
-                # Проверяем различные источники температуры
-                temp_sources = ['coretemp', 'k10temp', 'acpitz', 'it8686', 'it8688', 'it8655']
+                # Сначала читаем датчик, найденный ранее; полный поиск - только если
+                # он пропал или перестал давать значение
+                if self._psutil_source is not None:
+                    source, index = self._psutil_source
+                    try:
+                        temp = temps[source][index].current
+                    except (KeyError, IndexError):
+                        temp = 0.0
+                    if temp > 0:
+                        if debug:
+                            logger.debug(f"Температура из psutil ({source}): {temp}°C")
+                    else:
+                        self._psutil_source = None
                 
-                for source in temp_sources:
-                    if source in temps and temps[source]:
-                        # Ищем сначала 'Package id 0' или 'Tdie' для AMD
-                        for entry in temps[source]:
-                            if 'package' in entry.label.lower() or 'tdie' in entry.label.lower():
-                                temp = entry.current
-                                logger.debug(f"Температура из psutil ({source}): {temp}°C (сенсор: {entry.label})")
-                                break
-                        
-                        # Если не нашли package, берем первый доступный
-                        if temp == 0.0 and temps[source]:
-                            temp = temps[source][0].current
-                            logger.debug(f"Температура из psutil ({source}, fallback): {temp}°C")
-                        
-                        # Выходим после первого удачного источника
-                        if temp > 0:
-                            break
+                if self._psutil_source is None:
+                    temp = self._scan_psutil_temperature(temps, debug)
             except Exception as e:
                 logger.debug(f"Ошибка при чтении температуры через psutil: {e}")
         
         # 3. Если до сих пор не получили температуру, пробуем WMI ACPI
-        if temp == 0.0 and self.temp_sensors:
+        if temp == 0.0 and acpi_sensors:
             try:
                 temp_sources_tried.append("WMI ACPI")
                 # Температура в WMI дается в десятых долях Кельвина, конвертируем в Цельсий
-                temp = (self.temp_sensors[0].CurrentTemperature / 10.0) - 273.15
-                logger.debug(f"Температура из WMI ACPI: {temp}°C")
+                self._refresh_sensor(acpi_sensors[0])
+                temp = (acpi_sensors[0].CurrentTemperature / 10.0) - 273.15
+                if debug:
+                    logger.debug(f"Температура из WMI ACPI: {temp}°C")
             except Exception as e:
                 logger.debug(f"Ошибка при чтении температуры через WMI: {e}")
         
@@ -224,51 +509,23 @@ class HardwareMonitorService:
                 base_temp = 35.0
                 freq_ratio = freq.current / freq.max if freq.max else 0.5
                 temp = base_temp + (max_temp - base_temp) * freq_ratio * (load / 100.0)
-                logger.debug(f"Оценочная температура: {temp}°C (на основе загрузки и частоты)")
+                if debug:
+                    logger.debug(f"Оценочная температура: {temp}°C (на основе загрузки и частоты)")
             else:
                 # Совсем простая оценка только по нагрузке
                 temp = 35.0 + (load / 100.0) * 45.0
-                logger.debug(f"Оценочная температура (только загрузка): {temp}°C")
+                if debug:
+                    logger.debug(f"Оценочная температура (только загрузка): {temp}°C")
         
         # Если не смогли получить мощность, делаем оценку на основе TDP
         if power == 0.0:
-            # Предполагаемый TDP
-            if hasattr(self, 'estimated_tdp'):
-                tdp = self.estimated_tdp
-            else:
-                # Оценка TDP на основе типа CPU, для Intel обычно TDP указан в названии
-                # Например, для Core i7-8700K TDP = 95W
-                cpu_name = self.cpu_info.get('brand_raw', '')
-                tdp_match = re.search(r'(\d+)[WT]', cpu_name)
-                if tdp_match:
-                    tdp = int(tdp_match.group(1))
-                else:
-                    # Если TDP не найден в названии, используем типичные значения
-                    if 'i9' in cpu_name:
-                        tdp = 125
-                    elif 'i7' in cpu_name:
-                        tdp = 95
-                    elif 'i5' in cpu_name:
-                        tdp = 65
-                    elif 'i3' in cpu_name:
-                        tdp = 45
-                    elif 'ryzen 9' in cpu_name.lower():
-                        tdp = 105
-                    elif 'ryzen 7' in cpu_name.lower():
-                        tdp = 95
-                    elif 'ryzen 5' in cpu_name.lower():
-                        tdp = 65
-                    elif 'ryzen 3' in cpu_name.lower():
-                        tdp = 45
-                    else:
-                        tdp = 65  # Среднее значение для большинства десктопных CPU
-                
-                self.estimated_tdp = tdp
-                logger.info(f"Оценка TDP: {tdp}W для {cpu_name}")
+            if self._cpu_info is None:
+                self._resolve_cpu_info()
             
             # Оценка на основе загрузки (с коэффициентом эффективности)
-            power = tdp * (load / 100.0) * 0.8
-            logger.debug(f"Оценочная мощность: {power}W (на основе TDP={tdp}W и загрузки={load}%)")
+            power = self._power_per_load * load
+            if debug:
+                logger.debug(f"Оценочная мощность: {power}W (на основе TDP={self.estimated_tdp}W и загрузки={load}%)")
         
         # Обновление максимальных значений сессии
         if temp > self.max_temp_session:
@@ -284,6 +541,47 @@ class HardwareMonitorService:
         
         return (temp, power, load)
     
+    def _scan_psutil_temperature(self, temps: Dict[str, list], debug: bool) -> float:
+        """
+        Ищет температуру CPU среди всех известных источников psutil и запоминает
+        найденный датчик в self._psutil_source.
+        
+        Args:
+            temps: Результат psutil.sensors_temperatures()
+            debug: Включен ли уровень DEBUG
+            
+        Returns:
+            Температура в градусах Цельсия (0.0, если не найдена)
+        """
+        # Проверяем различные источники температуры
+        temp_sources = ['coretemp', 'k10temp', 'acpitz', 'it8686', 'it8688', 'it8655']
+        
+        for source in temp_sources:
+            entries = temps.get(source)
+            if not entries:
+                continue
+            
+            # Ищем сначала 'Package id 0' или 'Tdie' для AMD
+            for index, entry in enumerate(entries):
+                label = entry.label.lower()
+                if 'package' in label or 'tdie' in label:
+                    if entry.current > 0:
+                        if debug:
+                            logger.debug(f"Температура из psutil ({source}): {entry.current}°C (сенсор: {entry.label})")
+                        self._psutil_source = (source, index)
+                        return entry.current
+                    break
+            
+            # Если не нашли package, берем первый доступный
+            temp = entries[0].current
+            if temp > 0:
+                if debug:
+                    logger.debug(f"Температура из psutil ({source}, fallback): {temp}°C")
+                self._psutil_source = (source, 0)
+                return temp
+        
+        return 0.0
+    
     def get_cpu_frequencies(self) -> Dict[str, float]:
         """
         Получает текущие частоты CPU для всех ядер.
@@ -291,6 +589,12 @@ class HardwareMonitorService:
         Returns:
             Словарь с частотами ядер
         """
+        # Частоты не нужны с точностью до миллисекунд, а опрос по ядрам на Windows дорогой
+        now = time.monotonic()
+        timestamp, cached = self._freq_cache
+        if cached is not None and now - timestamp < INFO_CACHE_TTL:
+            return dict(cached)
+        
         result = {}
         
         # Попытка получить через psutil
@@ -322,7 +626,8 @@ class HardwareMonitorService:
             except Exception as e:
                 logger.debug(f"Ошибка при получении частот CPU через OHM: {e}")
         
-        return result
+        self._freq_cache = (now, result)
+        return dict(result)
     
     def get_memory_usage(self) -> Dict[str, float]:
         """
@@ -331,12 +636,19 @@ class HardwareMonitorService:
         Returns:
             Словарь с данными использования памяти
         """
+        now = time.monotonic()
+        timestamp, cached = self._memory_cache
+        if cached is not None and now - timestamp < INFO_CACHE_TTL:
+            return dict(cached)
+        
         memory = psutil.virtual_memory()
-        return {
+        result = {
             "total_gb": memory.total / (1024**3),
             "used_gb": memory.used / (1024**3),
             "percent": memory.percent
         }
+        self._memory_cache = (now, result)
+        return dict(result)
     
     def collect_system_info(self) -> Dict[str, Any]:
         """
@@ -365,6 +677,9 @@ class HardwareMonitorService:
     
     def close(self):
         """Освобождает ресурсы мониторинга"""
+        self._ohm_stop.set()
+        if self._ohm_thread is not None:
+            self._ohm_thread.join(timeout=2.0)
         try:
             pythoncom.CoUninitialize()
         except:
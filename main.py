@@ -4,29 +4,182 @@
 """
 import os
 import sys
-import tkinter as tk
 import ctypes
 import logging
+import logging.handlers
 import json
-import traceback
+import mmap
+import time
+import queue
+import atexit
+import threading
 from pathlib import Path
 from datetime import datetime
+from typing import NamedTuple, Optional
 
-from main_window import MainWindow
-from cpu_profile import CPUProfile
+# orjson (если установлен) сериализует состояние быстрее стандартного json;
+# обе реализации работают с байтами в UTF-8
+try:
+    import orjson
+    
+    def _dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    
+    # orjson разбирает memoryview без копирования
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(data):
+        return (json.dumps(data, indent=2) + '\n').encode('utf-8')
+    
+    def _loads(data):
+        return json.loads(bytes(data))
+
+class FastFileHandler(logging.Handler):
+    """
+    Обработчик логов, дописывающий в файл готовые байты через буфер.
+    
+    Буфер сбрасывается, когда очередь записей опустела, поэтому серия сообщений
+    записывается одним системным вызовом, а на диск не попадают только записи
+    из еще не обработанной серии.
+    """
+    
+    def __init__(self, filename, idle_queue=None, buffer_size=1 << 16,
+                 max_bytes=0, backup_count=0):
+        """
+        Инициализация обработчика.
+        
+        Args:
+            filename: Путь к файлу лога
+            idle_queue: Очередь записей; буфер сбрасывается, когда она пуста
+                (None - сбрасывать после каждой записи)
+            buffer_size: Размер буфера записи в байтах
+            max_bytes: Размер файла, после которого он переименовывается в
+                filename.1, filename.2... (0 - без ротации)
+            backup_count: Количество хранимых старых файлов
+        """
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self._idle_queue = idle_queue
+        self._buffer_size = buffer_size
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        # Файл открывается в двоичном режиме: переводы строк (в том числе внутри
+        # трассировок исключений) приводятся к принятым в системе явно
+        self._newline = os.linesep
+        self._file = self._open()
+        self._size = os.fstat(self._file.fileno()).st_size
+    
+    def _open(self):
+        """Открывает файл лога для дозаписи"""
+        fd = os.open(self.baseFilename, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        return os.fdopen(fd, 'ab', buffering=self._buffer_size)
+    
+    def _rollover(self):
+        """Сдвигает старые файлы лога (как RotatingFileHandler) и начинает новый"""
+        self._file.close()
+        rotating = self.baseFilename + ".rotating"
+        try:
+            # Сначала убираем текущий файл: если он занят другим процессом
+            # (на Windows его нельзя переименовать), резервные копии не трогаем
+            if self._backup_count > 0:
+                os.replace(self.baseFilename, rotating)
+            else:
+                os.remove(self.baseFilename)
+        except OSError:
+            # Продолжаем писать в тот же файл; следующая попытка - через max_bytes
+            self._file = self._open()
+            self._size = 0
+            return
+        
+        if self._backup_count > 0:
+            try:
+                for i in range(self._backup_count - 1, 0, -1):
+                    source = f"{self.baseFilename}.{i}"
+                    if os.path.exists(source):
+                        os.replace(source, f"{self.baseFilename}.{i + 1}")
+                os.replace(rotating, self.baseFilename + ".1")
+            except OSError:
+                # Копия занята - старый лог остается в файле .rotating
+                pass
+        self._file = self._open()
+        self._size = os.fstat(self._file.fileno()).st_size
+    
+    def emit(self, record):
+        try:
+            text = self.format(record) + '\n'
+            if self._newline != '\n':
+                text = text.replace('\n', self._newline)
+            data = text.encode('utf-8', 'replace')
+            if self._max_bytes and self._size and self._size + len(data) > self._max_bytes:
+                self._rollover()
+            self._file.write(data)
+            self._size += len(data)
+            if self._idle_queue is None or self._idle_queue.empty():
+                self._file.flush()
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        with self.lock:
+            if not self._file.closed:
+                self._file.flush()
+    
+    def close(self):
+        with self.lock:
+            if not self._file.closed:
+                self._file.close()
+        super().close()
 
 # Настройка логирования
+def _existing_dirs():
+    """Возвращает имена подкаталогов текущего каталога (одним чтением каталога)"""
+    try:
+        with os.scandir('.') as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        return set()
+
+# Каталоги создаются только если их нет (в обычном случае они уже существуют)
+_EXISTING_DIRS = _existing_dirs()
+
 LOG_DIR = "logs"
-os.makedirs(LOG_DIR, exist_ok=True)
-log_file = os.path.join(LOG_DIR, f"tuner_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
+if LOG_DIR not in _EXISTING_DIRS:
+    os.makedirs(LOG_DIR, exist_ok=True)
+# Ротация общего файла лога: не более LOG_MAX_BYTES в файле и LOG_BACKUP_COUNT старых файлов
+LOG_MAX_BYTES = 4 * 1024 * 1024
+LOG_BACKUP_COUNT = 8
+# Сколько отдельных логов с меткой времени (tuner_*.log) хранить
+LOG_KEEP_TIMESTAMPED = 32
 
+# Запись в файл и консоль выполняет фоновый поток QueueListener: вызов логгера
+# в потоке GUI только кладет запись в очередь
+_log_queue = queue.SimpleQueue()
+
+# Все запуски (в том числе перезапуск с правами администратора) пишут в один файл;
+# с флагом --fresh-log для отладки создается отдельный файл с меткой времени
+if '--fresh-log' in sys.argv[1:]:
+    log_file = os.path.join(LOG_DIR, f"tuner_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
+    _log_file_handler = FastFileHandler(log_file, idle_queue=_log_queue)
+else:
+    log_file = os.path.join(LOG_DIR, "tuner.log")
+    _log_file_handler = FastFileHandler(log_file, idle_queue=_log_queue,
+                                        max_bytes=LOG_MAX_BYTES, backup_count=LOG_BACKUP_COUNT)
+
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_handlers = [_log_file_handler, logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# QueueHandler подставляет в запись готовый текст сообщения (с трассировкой исключения),
+# формат со временем и уровнем применяют обработчики слушателя
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file, encoding='utf-8'),
-        logging.StreamHandler()
-    ]
+    format='%(message)s',
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
 
 logger = logging.getLogger("cpu_tuner")
@@ -34,90 +187,349 @@ logger = logging.getLogger("cpu_tuner")
 # Файл для хранения состояния тюнинга
 STATE_FILE = "tuning_state.json"
 CHECKPOINT_DIR = "checkpoints"
-os.makedirs(CHECKPOINT_DIR, exist_ok=True)
+if CHECKPOINT_DIR not in _EXISTING_DIRS:
+    os.makedirs(CHECKPOINT_DIR, exist_ok=True)
+
+# Пути к файлам состояния, вычисленные один раз
+STATE_PATH = Path(STATE_FILE)
+STATE_TEMP_PATH = Path(STATE_FILE + ".tmp")
+# Пустой файл-маркер: существует, пока последнее записанное состояние не 'in_progress'
+STATE_DONE_PATH = Path(STATE_FILE + ".done")
+CHECKPOINT_PATH = Path(CHECKPOINT_DIR)
+
+# Максимальный возраст точки восстановления (сек): более старая точка не предлагается,
+# так как состояние системы (BIOS, прошивки) могло с тех пор измениться
+CHECKPOINT_MAX_AGE = 24 * 3600
+
+# Задержка перед записью состояния (сек): за это время более новое состояние
+# заменяет ожидающее, и на диск попадает только последнее
+STATE_WRITE_DELAY = 0.05
+
+# Ячейка для фонового потока записи: новое состояние просто заменяет ожидающее.
+# _state_ready будит поток записи, _state_idle установлен, когда записывать нечего
+_pending_state = None
+_state_lock = threading.Lock()
+_state_ready = threading.Event()
+_state_idle = threading.Event()
+_state_idle.set()
+_writer_thread = None
+
+# Последние сохраненные (статус, точка восстановления); повторы не записываются
+_last_state = None
+
+def _check_admin():
+    """Однократная проверка прав администратора текущего процесса"""
+    if sys.platform == 'win32':
+        try:
+            shell32 = ctypes.WinDLL('shell32', use_last_error=True)
+            is_user_an_admin = shell32.IsUserAnAdmin
+            is_user_an_admin.restype = ctypes.c_int
+            is_user_an_admin.argtypes = []
+            return bool(is_user_an_admin())
+        except (OSError, AttributeError):
+            return False
+    return os.geteuid() == 0
+
+# Права процесса не меняются во время работы, поэтому проверяются один раз при загрузке
+IS_ADMIN = _check_admin()
+
+# Аргумент командной строки, которым помечается перезапуск с повышенными правами
+ELEVATED_FLAG = "--elevated"
 
 def is_admin():
     """Проверка наличия прав администратора"""
-    try:
-        return ctypes.windll.shell32.IsUserAnAdmin() != 0
-    except:
-        return False
+    return IS_ADMIN
 
 def run_as_admin():
-    """Повторный запуск программы с повышенными правами"""
+    """
+    Повторный запуск программы с повышенными правами.
+    
+    Returns:
+        True, если процесс с повышенными правами запущен
+    """
     try:
+        # Признак перезапуска: повторный запуск без прав не будет снова запрашивать UAC
+        params = ' '.join(sys.argv[1:] + [ELEVATED_FLAG])
         if sys.argv[0].endswith('.py'):
             # Если запуск из .py файла
             script = sys.argv[0]
-            params = ' '.join(sys.argv[1:])
-            ctypes.windll.shell32.ShellExecuteW(
+            result = ctypes.windll.shell32.ShellExecuteW(
                 None, "runas", sys.executable, f'"{script}" {params}', None, 1
             )
         else:
             # Если запуск из .exe или другого исполняемого файла
-            ctypes.windll.shell32.ShellExecuteW(
-                None, "runas", sys.argv[0], ' '.join(sys.argv[1:]), None, 1
+            result = ctypes.windll.shell32.ShellExecuteW(
+                None, "runas", sys.argv[0], params, None, 1
             )
-    except Exception as e:
+    except (OSError, AttributeError) as e:
+        # AttributeError - ctypes.windll отсутствует вне Windows
         logger.error(f"Не удалось запустить с правами администратора: {e}")
         print(f"ОШИБКА: Не удалось запустить с правами администратора: {e}")
+        return False
+    
+    # ShellExecuteW возвращает значение больше 32 при успехе (иначе - код ошибки,
+    # например, если пользователь отклонил запрос UAC)
+    if result <= 32:
+        logger.error(f"Не удалось запустить с правами администратора (код {result})")
+        print(f"ОШИБКА: Не удалось запустить с правами администратора (код {result})")
+        return False
+    return True
+
+def _prune_logs(max_keep=LOG_KEEP_TIMESTAMPED):
+    """
+    Удаляет старые логи с меткой времени, оставляя max_keep самых новых.
+    
+    Args:
+        max_keep: Количество сохраняемых файлов
+    """
+    try:
+        # DirEntry хранит данные из чтения каталога (на Windows - вместе с временем
+        # изменения), поэтому отдельный stat на каждый файл не нужен
+        with os.scandir(LOG_DIR) as entries:
+            logs = sorted((entry for entry in entries
+                           if entry.name.startswith('tuner_') and entry.name.endswith('.log')
+                           and entry.is_file()),
+                          key=lambda entry: entry.stat().st_mtime, reverse=True)
+        current = os.path.abspath(log_file)
+        for entry in logs[max_keep:]:
+            if os.path.abspath(entry.path) != current:
+                os.unlink(entry.path)
+    except OSError as e:
+        logger.warning(f"Не удалось удалить старые логи: {e}")
 
 def check_for_crash_recovery():
     """
     Проверяет, не произошел ли сбой во время предыдущего запуска тюнинга.
     Возвращает имя точки восстановления, если найдена, иначе None.
     """
-    if not os.path.exists(STATE_FILE):
+    # Обычный случай (предыдущий запуск завершился штатно) обходится без чтения файла
+    if STATE_DONE_PATH.exists():
+        return None
+    try:
+        if STATE_PATH.stat().st_size == 0:
+            return None
+    except FileNotFoundError:
         return None
     
     try:
-        with open(STATE_FILE, 'r', encoding='utf-8') as f:
-            state = json.load(f)
+        # Файл отображается в память и разбирается без промежуточной копии
+        # (пустой файл отсечен выше; mmap для него выдал бы ValueError)
+        with open(STATE_PATH, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                memoryview(mapped) as view:
+            state = _loads(view)
         
         if state.get('status') == 'in_progress':
             logger.info("Обнаружено незавершенное состояние тюнинга")
             checkpoint_file = state.get('last_checkpoint')
-            if checkpoint_file and os.path.exists(os.path.join(CHECKPOINT_DIR, checkpoint_file)):
-                return checkpoint_file
-    except Exception as e:
+            if checkpoint_file:
+                try:
+                    age = time.time() - (CHECKPOINT_PATH / checkpoint_file).stat().st_mtime
+                except FileNotFoundError:
+                    return None
+                if age <= CHECKPOINT_MAX_AGE:
+                    return checkpoint_file
+                logger.info(f"Точка восстановления {checkpoint_file} устарела и пропущена")
+    except (OSError, ValueError) as e:
+        # STATE_FILE публикуется атомарно, поэтому ошибка разбора означает поврежденный
+        # файл, а не недописанное состояние; прочие исключения - ошибки программы
         logger.error(f"Ошибка при проверке состояния восстановления: {e}")
     
     return None
 
+class TuningState(NamedTuple):
+    """Состояние тюнинга, записываемое в STATE_FILE"""
+    status: str                      # 'idle', 'in_progress', 'completed', 'failed'...
+    timestamp: str                   # Время изменения состояния (ISO 8601)
+    last_checkpoint: Optional[str]   # Имя файла последней точки восстановления
+
+# Заранее сериализованное состояние для каждого известного статуса: при записи
+# подставляются только время и точка восстановления (формат совпадает с _dumps)
+_STATE_TEMPLATES = {
+    status: (b'{\n  "status": "' + status.encode('ascii') +
+             b'",\n  "timestamp": "%s",\n  "last_checkpoint": %s\n}\n')
+    for status in ('idle', 'in_progress', 'completed', 'failed', 'reboot_pending')
+}
+
+def _serialize_state(state):
+    """
+    Сериализует состояние тюнинга в JSON (UTF-8).
+    
+    Args:
+        state: Состояние тюнинга
+        
+    Returns:
+        JSON-представление состояния в байтах
+    """
+    template = _STATE_TEMPLATES.get(state.status)
+    if template is None:
+        return _dumps(state._asdict())
+    
+    checkpoint = b'null'
+    if state.last_checkpoint is not None:
+        checkpoint = json.dumps(state.last_checkpoint, ensure_ascii=False).encode('utf-8')
+    return template % (state.timestamp.encode('ascii'), checkpoint)
+
+def _sync_file(path):
+    """Сбрасывает на диск уже записанный файл"""
+    with open(path, 'r+b') as f:
+        os.fsync(f.fileno())
+
+def _write_state_file(state):
+    """
+    Атомарно записывает состояние тюнинга в STATE_FILE.
+    
+    Записи упорядочены: сначала на диск сбрасывается точка восстановления, на которую
+    ссылается состояние, затем само состояние, и только после этого оно публикуется
+    переименованием. После сбоя STATE_FILE не ссылается на недописанную точку.
+    
+    Args:
+        state: Состояние тюнинга
+        
+    Returns:
+        True, если состояние опубликовано в STATE_FILE
+    """
+    try:
+        checkpoint = state.last_checkpoint
+        if checkpoint:
+            _sync_file(CHECKPOINT_PATH / checkpoint)
+        
+        # Маркер завершения снимается до публикации 'in_progress' и ставится после
+        # публикации остальных статусов, чтобы он никогда не скрывал незавершенный тюнинг
+        in_progress = state.status == 'in_progress'
+        if in_progress:
+            try:
+                STATE_DONE_PATH.unlink()
+            except FileNotFoundError:
+                pass
+        
+        with open(STATE_TEMP_PATH, 'wb') as f:
+            f.write(_serialize_state(state))
+            f.flush()
+            os.fsync(f.fileno())
+        # При сбое во время записи на диске остается предыдущее состояние
+        os.replace(STATE_TEMP_PATH, STATE_PATH)
+        
+        if not in_progress:
+            STATE_DONE_PATH.touch()
+        return True
+    except OSError as e:
+        logger.error(f"Ошибка при сохранении состояния тюнинга: {e}")
+        return False
+
+def _state_writer_loop():
+    """Цикл фонового потока, записывающего состояния тюнинга на диск"""
+    global _pending_state, _last_state
+    while True:
+        # Поток спит до появления состояния (без периодического опроса)
+        _state_ready.wait()
+        time.sleep(STATE_WRITE_DELAY)
+        
+        # Событие сбрасывается до чтения ячейки: состояние, отправленное позже,
+        # снова разбудит поток
+        _state_ready.clear()
+        with _state_lock:
+            state, _pending_state = _pending_state, None
+        
+        written = True
+        try:
+            if state is not None:
+                written = _write_state_file(state)
+        finally:
+            with _state_lock:
+                # Незаписанное состояние не должно подавлять повторную попытку
+                if not written and _last_state == (state.status, state.last_checkpoint):
+                    _last_state = None
+                if _pending_state is None:
+                    _state_idle.set()
+
+def _start_state_writer():
+    """Запускает фоновый поток записи состояния (однократно)"""
+    global _writer_thread
+    if _writer_thread is None:
+        _writer_thread = threading.Thread(target=_state_writer_loop, name="state-io", daemon=True)
+        _writer_thread.start()
+        atexit.register(_flush_state_writer)
+
+def _flush_state_writer():
+    """Дожидается записи всех отправленных состояний тюнинга"""
+    if _writer_thread is not None and _writer_thread.is_alive():
+        _state_idle.wait()
+
 def save_tuning_state(status, checkpoint=None):
     """
     Сохраняет текущее состояние тюнинга.
     
+    Запись выполняется фоновым потоком, поэтому вызов не блокирует GUI;
+    из нескольких состояний, отправленных подряд, на диск попадает последнее.
+    
     Args:
         status: Статус тюнинга ('in_progress', 'completed', 'failed')
         checkpoint: Имя файла последней точки восстановления
     """
-    state = {
-        'status': status,
-        'timestamp': datetime.now().isoformat(),
-        'last_checkpoint': checkpoint
-    }
+    global _last_state, _pending_state
     
-    try:
-        with open(STATE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(state, f, indent=2)
-    except Exception as e:
-        logger.error(f"Ошибка при сохранении состояния тюнинга: {e}")
+    # Состояние на диске читается только при следующем запуске, поэтому повтор того же
+    # статуса с той же точкой восстановления (отличается лишь время) не записывается
+    key = (status, checkpoint)
+    with _state_lock:
+        if key == _last_state:
+            return
+        _last_state = key
+        
+        # Словарь для записи собирается уже в потоке записи
+        state = TuningState(status, datetime.now().isoformat(), checkpoint)
+        
+        if _writer_thread is None:
+            # Ключ запоминается только для записанного состояния
+            if not _write_state_file(state):
+                _last_state = None
+            return
+        
+        # Ожидающее (еще не записанное) состояние устарело - заменяем его
+        _pending_state = state
+        _state_idle.clear()
+    _state_ready.set()
 
 def main():
     """Основная функция запуска приложения"""
     logger.info("Запуск CPU Profile Tuner")
     
+    elevated = ELEVATED_FLAG in sys.argv[1:]
+    if elevated:
+        sys.argv.remove(ELEVATED_FLAG)
+    
     # Проверка прав администратора
     if not is_admin():
+        if elevated:
+            # Процесс уже перезапускался для повышения прав - не запрашиваем их повторно
+            logger.error("Не удалось получить права администратора после перезапуска")
+            print("ОШИБКА: Не удалось получить права администратора.")
+            sys.exit(1)
+        
         logger.warning("Программа запущена без прав администратора")
         print("Для изменения настроек BIOS требуются права администратора.")
         print("Запрашиваю повышение привилегий...")
-        run_as_admin()
-        return
+        if not run_as_admin():
+            sys.exit(1)
+        
+        # Дальше работает процесс с повышенными правами: записываем логи и
+        # завершаемся сразу, без штатного завершения интерпретатора
+        # (os._exit не вызывает logging.shutdown, поэтому буфер файла сбрасываем сами)
+        _log_listener.stop()
+        _log_file_handler.flush()
+        os._exit(0)
+    
+    _prune_logs()
     
     # Проверка на наличие прерванного тюнинга для восстановления
     recovery_checkpoint = check_for_crash_recovery()
+    _start_state_writer()
+    
+    # Tk и модули приложения импортируются только после проверки прав:
+    # без них процесс сразу перезапускается с повышенными правами
+    import tkinter as tk
+    from main_window import MainWindow
     
     # Создание GUI
     root = tk.Tk()
@@ -135,11 +547,15 @@ def main():
     try:
         root.mainloop()
     except Exception as e:
-        logger.error(f"Необработанное исключение в главном цикле: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Необработанное исключение в главном цикле: {e}")
         save_tuning_state('failed')
     finally:
-        # Закрытие логгера
+        # Запись последнего состояния до закрытия логгера
+        _flush_state_writer()
+        
+        # Запись оставшихся сообщений из очереди и закрытие логгера
+        atexit.unregister(_log_listener.stop)
+        _log_listener.stop()
         logging.shutdown()
 
 if __name__ == "__main__":
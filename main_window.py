@@ -5,7 +5,10 @@
 import os
 import time
 import logging
+import queue
 import threading
+import subprocess
+from collections import deque
 import tkinter as tk
 from tkinter import ttk, scrolledtext, filedialog, messagebox
 from typing import Optional, Callable, Dict, Any
@@ -17,6 +20,111 @@ from cpu_profile import CPUProfile
 
 logger = logging.getLogger("cpu_tuner")
 
+# Интервал (мс) вывода накопленных сообщений в лог
+LOG_FLUSH_INTERVAL = 100
+
+# Максимальное количество строк в виджете лога (старые строки удаляются)
+LOG_MAX_LINES = 5000
+
+# Интервал (мс) выполнения в UI потоке действий, переданных из фоновых потоков,
+# и максимальное количество действий за один проход
+UI_QUEUE_INTERVAL = 30
+UI_QUEUE_BATCH = 50
+
+# Интервал (мс) шага анимации индикатора прогресса в неопределенном режиме (анимация
+# идет все время тюнинга, поэтому частота кадров ограничена ~20 в секунду)
+PROGRESS_ANIMATION_INTERVAL = 50
+
+# Интервал (мс) обновления данных CPU в строке статуса
+STATUS_POLL_INTERVAL = 5000
+
+# Состояния кнопок по режимам окна (кнопки, не указанные в режиме, не изменяются;
+# кнопка сохранения после тюнинга зависит от наличия профиля)
+BUTTON_STATES = {
+    'ready': {'start': tk.NORMAL, 'load': tk.NORMAL, 'restore': tk.NORMAL, 'stop': tk.DISABLED},
+    'running': {'start': tk.DISABLED, 'load': tk.DISABLED, 'save': tk.DISABLED,
+                'restore': tk.DISABLED, 'stop': tk.NORMAL},
+    'busy': {'start': tk.DISABLED, 'load': tk.DISABLED, 'save': tk.DISABLED,
+             'restore': tk.DISABLED, 'stop': tk.DISABLED},
+}
+
+# Типы файлов для диалогов выбора профиля и SCEWIN
+PROFILE_FILETYPES = (("JSON файлы", "*.json"), ("Все файлы", "*.*"))
+SCEWIN_FILETYPES = (("Исполняемые файлы", "*.exe"), ("Все файлы", "*.*"))
+
+# Диалоги сохранения профиля, восстановления настроек и закрытия окна: (заголовок, текст);
+# поля в фигурных скобках подставляются через str.format
+MSG_NO_PROFILE = (
+    "Нет профиля",
+    "Нет текущего профиля для сохранения.\n\n"
+    "Сначала выполните тюнинг или загрузите профиль."
+)
+MSG_PROFILE_SAVED = ("Профиль сохранен", "Профиль успешно сохранен в файл:\n{path}")
+MSG_PROFILE_SAVE_FAILED = ("Ошибка сохранения профиля", "Не удалось сохранить профиль: {error}")
+MSG_RESTORE_UNAVAILABLE = ("Ошибка", "Сервисы не инициализированы. Невозможно восстановить настройки.")
+MSG_CONFIRM_RESTORE = (
+    "Подтверждение восстановления",
+    "Вы уверены, что хотите восстановить настройки BIOS до исходных значений?\n\n"
+    "Все изменения, сделанные тюнером, будут сброшены."
+)
+MSG_RESTORE_FAILED = ("Ошибка восстановления", "Не удалось восстановить настройки: {error}")
+MSG_RESTORED = ("Настройки восстановлены", "Исходные настройки BIOS успешно восстановлены.")
+MSG_RESTORE_INCOMPLETE = (
+    "Предупреждение",
+    "Не удалось восстановить исходные настройки BIOS.\n\n"
+    "Проверьте лог для получения дополнительной информации."
+)
+MSG_CONFIRM_CLOSE = (
+    "Прервать тюнинг?",
+    "В данный момент идет процесс тюнинга.\n\n"
+    "Вы уверены, что хотите закрыть программу и прервать тюнинг?"
+)
+
+# Команда перезагрузки для применения настроек BIOS
+REBOOT_COMMAND = ["shutdown", "/r", "/t", "5", "/c", "Перезагрузка для применения настроек BIOS"]
+
+# Флаг запуска процесса без окна консоли (есть только в Windows)
+CREATE_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+# Интервал (мс) проверки завершения команды перезагрузки
+REBOOT_CHECK_INTERVAL = 100
+
+# Шаблон вкладки системной информации (поля - из _flatten_system_info)
+SYSINFO_TEMPLATE = (
+    "=== Информация о системе ===\n"
+    "Платформа: {platform}\n"
+    "Процессор: {cpu_brand}\n"
+    "Ядра/потоки: {core_count}/{thread_count}\n"
+    "Архитектура: {arch}\n"
+    "\n"
+    "=== Оперативная память ===\n"
+    "Всего: {total_gb:.1f} ГБ\n"
+    "Использовано: {used_gb:.1f} ГБ ({memory_percent}%)\n"
+    "\n"
+    "=== Текущее состояние ===\n"
+    "Температура CPU: {cpu_temperature:.1f}°C\n"
+    "Мощность CPU: {cpu_power:.1f}W\n"
+    "Загрузка CPU: {cpu_load:.1f}%"
+)
+
+# Поля шаблона SYSINFO_TEMPLATE: (поле, раздел system_info или None, ключ, значение по умолчанию)
+SYSINFO_FIELDS = (
+    ('platform', None, 'platform', 'Неизвестно'),
+    ('cpu_brand', 'cpu', 'brand_raw', 'Неизвестно'),
+    ('core_count', 'cpu', 'core_count', 0),
+    ('thread_count', 'cpu', 'thread_count', 0),
+    ('arch', 'cpu', 'arch', 'Неизвестно'),
+    ('total_gb', 'memory', 'total_gb', 0),
+    ('used_gb', 'memory', 'used_gb', 0),
+    ('memory_percent', 'memory', 'percent', 0),
+    ('cpu_temperature', None, 'cpu_temperature', 0),
+    ('cpu_power', None, 'cpu_power', 0),
+    ('cpu_load', None, 'cpu_load', 0),
+)
+
+# Общий пустой раздел для отсутствующих 'cpu'/'memory' (не создается при каждом вызове)
+_EMPTY_SECTION = {}
+
 class MainWindow:
     """
     Основной класс графического интерфейса для CPU Profile Tuner.
@@ -54,24 +162,56 @@ class MainWindow:
         
         # Переменные Tkinter
         self.status_var = tk.StringVar(value="Готов к работе")
+        
+        # Текст, записанный в status_var последним (сравнение без обращения к Tcl)
+        self._last_status = self.status_var.get()
         self.progress_var = tk.DoubleVar(value=0.0)
         
-        # Текущий профиль
+        # Запущена ли анимация индикатора прогресса
+        self._progress_indeterminate = False
+        
+        # Текущий профиль и флаг выполняющегося сохранения профиля
         self.current_profile = None
+        self._save_in_progress = False
+        
+        # Действия над виджетами из фоновых потоков: (функция, аргументы)
+        self._ui_queue = queue.Queue()
+        
+        # Последние данные CPU (температура, мощность, нагрузка) от фонового опроса.
+        # Поток опроса заменяет кортеж целиком, UI поток только читает его
+        self._latest_stats = None
+        self._monitor_stop = threading.Event()
+        self._window_iconic = False
+        
+        # Данные, выведенные на вкладку системной информации в последний раз
+        self._last_sysinfo_key = None
+        
+        # Строки, ожидающие вывода в лог (добавляются из любого потока). Сообщения
+        # из UI потока дополнительно выводятся в ближайший простой (after_idle) -
+        # флаг не дает запланировать вывод повторно
+        self._log_queue = deque()
+        self._log_idle_pending = False
+        self._ui_thread_id = threading.get_ident()
+        
+        # Метка времени для лога, пересчитываемая раз в секунду: (секунда, "ЧЧ:ММ:СС").
+        # Хранится одним кортежем, чтобы потоки не видели секунду от другой строки
+        self._log_timestamp = (0, "")
         
         # Создаем виджеты
         self._create_widgets()
         
         # Инициализируем сервисы в отдельном потоке
-        self.init_thread = threading.Thread(target=self._init_services)
-        self.init_thread.daemon = True
-        self.init_thread.start()
+        self.init_thread = self._start_worker("init", self._init_services)
         
         # Устанавливаем обработчик закрытия окна
         root.protocol("WM_DELETE_WINDOW", self._on_close)
         
         # Периодическое обновление статуса
         self._schedule_status_update()
+        
+        # Выполнение действий, переданных из фоновых потоков, и вывод лога
+        self._drain_ui_queue()
+        self._flush_log()
     
     def _setup_styles(self):
         """Настройка стилей интерфейса"""
@@ -182,40 +322,41 @@ class MainWindow:
         log_frame = ttk.Frame(self.notebook)
         self.notebook.add(log_frame, text='Лог')
         
-        # Текстовое поле для лога
-        self.log_text = scrolledtext.ScrolledText(
+        # Список строк лога: лог только дополняется, а вставка в Listbox не требует
+        # перерасчета разметки всего содержимого, как в Text
+        log_scroll_y = ttk.Scrollbar(log_frame, orient=tk.VERTICAL)
+        log_scroll_x = ttk.Scrollbar(log_frame, orient=tk.HORIZONTAL)
+        self.log_list = tk.Listbox(
             log_frame,
-            wrap=tk.WORD,
-            font=('Consolas', 10)
+            font=('Consolas', 10),
+            activestyle='none',
+            yscrollcommand=log_scroll_y.set,
+            xscrollcommand=log_scroll_x.set
         )
-        self.log_text.pack(fill=tk.BOTH, expand=True)
-        self.log_text.config(state=tk.DISABLED)
-        
-        # Вкладка результатов
+        log_scroll_y.config(command=self.log_list.yview)
+        log_scroll_x.config(command=self.log_list.xview)
+        log_scroll_y.pack(side=tk.RIGHT, fill=tk.Y)
+        log_scroll_x.pack(side=tk.BOTTOM, fill=tk.X)
+        self.log_list.pack(fill=tk.BOTH, expand=True)
+        
+        # Вкладки результатов и системной информации: текстовые поля создаются
+        # при первом открытии вкладки (_on_tab_changed), до этого текст только запоминается
         results_frame = ttk.Frame(self.notebook)
         self.notebook.add(results_frame, text='Результаты')
-        
-        # Текстовое поле для результатов
-        self.results_text = scrolledtext.ScrolledText(
-            results_frame,
-            wrap=tk.WORD,
-            font=('Consolas', 10)
-        )
-        self.results_text.pack(fill=tk.BOTH, expand=True)
-        self.results_text.config(state=tk.DISABLED)
-        
-        # Вкладка системной информации
         sysinfo_frame = ttk.Frame(self.notebook)
         self.notebook.add(sysinfo_frame, text='Система')
         
-        # Текстовое поле для системной информации
-        self.sysinfo_text = scrolledtext.ScrolledText(
-            sysinfo_frame,
-            wrap=tk.WORD,
-            font=('Consolas', 10)
-        )
-        self.sysinfo_text.pack(fill=tk.BOTH, expand=True)
-        self.sysinfo_text.config(state=tk.DISABLED)
+        # Вкладка (путь виджета) -> имя; имя -> фрейм, текстовое поле, последний текст
+        self._lazy_tabs = {str(results_frame): 'results', str(sysinfo_frame): 'sysinfo'}
+        self._tab_frames = {'results': results_frame, 'sysinfo': sysinfo_frame}
+        self._tab_widgets = {}
+        self._tab_content = {}
+        
+        # Профиль для вкладки результатов и флаг "отчет еще не выведен": пока вкладка
+        # скрыта, отчет не формируется
+        self._results_profile = None
+        self._results_dirty = False
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
         # Предупреждение внизу
         warning_frame = ttk.Frame(main_frame)
@@ -230,11 +371,92 @@ class MainWindow:
         )
         warning_label.pack()
     
+    def _on_tab_changed(self, event=None):
+        """Создает текстовое поле вкладки при первом ее открытии и выводит отложенный отчет"""
+        name = self._lazy_tabs.get(self.notebook.select())
+        if name is None:
+            return
+        
+        if name not in self._tab_widgets:
+            widget = scrolledtext.ScrolledText(
+                self._tab_frames[name],
+                wrap=tk.WORD,
+                font=('Consolas', 10)
+            )
+            widget.pack(fill=tk.BOTH, expand=True)
+            self._tab_widgets[name] = widget
+            self._replace_text(widget, self._tab_content.get(name, ""))
+        
+        if name == 'results' and self._results_dirty:
+            self._render_results()
+    
+    def _set_tab_text(self, name, text):
+        """
+        Задает текст вкладки 'results' или 'sysinfo'.
+        
+        Args:
+            name: Имя вкладки
+            text: Новый текст
+        """
+        self._tab_content[name] = text
+        widget = self._tab_widgets.get(name)
+        if widget is not None:
+            self._replace_text(widget, text)
+    
+    @staticmethod
+    def _replace_text(widget, text):
+        """Заменяет содержимое текстового поля (только для чтения)"""
+        # Одна команда replace - без промежуточной разметки пустого виджета
+        widget.config(state=tk.NORMAL)
+        widget.replace(1.0, tk.END, text)
+        widget.config(state=tk.DISABLED)
+    
+    @staticmethod
+    def _start_worker(name, target, *args):
+        """
+        Запускает фоновый поток-демон (не задерживает выход из программы).
+        
+        Args:
+            name: Имя потока (для логов и отладчика)
+            target: Функция потока
+            *args: Аргументы функции
+            
+        Returns:
+            Запущенный поток
+        """
+        thread = threading.Thread(target=target, args=args, name=name, daemon=True)
+        thread.start()
+        return thread
+    
+    def _post(self, fn, *args):
+        """
+        Передает вызов функции в UI поток (можно вызывать из любого потока).
+        
+        Args:
+            fn: Функция, работающая с виджетами
+            *args: Аргументы функции
+        """
+        self._ui_queue.put_nowait((fn, args))
+    
+    def _drain_ui_queue(self):
+        """Выполняет в UI потоке действия, переданные через _post"""
+        for _ in range(UI_QUEUE_BATCH):
+            try:
+                fn, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn(*args)
+            except Exception as e:
+                logger.error(f"Ошибка при обновлении интерфейса: {e}", exc_info=True)
+        
+        self.root.after(UI_QUEUE_INTERVAL, self._drain_ui_queue)
+    
     def _init_services(self):
         """Инициализация сервисов в фоновом потоке"""
         try:
-            self._update_status("Инициализация сервисов...")
-            self._set_progress_indeterminate(True)
+            self._post(self._update_status, "Инициализация сервисов...")
+            self._post(self._set_progress_indeterminate, True)
             
             # Инициализация сервиса мониторинга
             self.append_log("Инициализация сервиса мониторинга железа...")
@@ -253,46 +475,58 @@ class MainWindow:
                     self.append_log(f"Найден SCEWIN в текущей директории")
                 else:
                     # Предлагаем выбрать файл
-                    self.root.after(0, self._ask_for_scewin_path)
+                    self._post(self._ask_for_scewin_path)
                     return
             
-            self.bios = BiosService(scewin_path)
-            
-            # Инициализация движка тюнинга
-            self.append_log("Инициализация движка тюнинга...")
-            self.tuner = TuningEngine(self.monitor, self.bios, checkpoint_dir=self.checkpoint_dir)
-            self.tuner.log_callback = self.append_log
-            
-            # Получаем информацию о системе
-            self.append_log("Получение информации о системе...")
-            system_info = self.monitor.collect_system_info()
-            self._update_system_info(system_info)
-            
-            # Все сервисы инициализированы
-            self.is_services_initialized = True
-            self._update_status("Готов к работе")
-            self._set_progress_indeterminate(False)
-            
-            # Включаем кнопки
-            self.root.after(0, self._enable_buttons)
-            
-            # Проверяем наличие точки восстановления
-            if self.recovery_checkpoint:
-                self.root.after(0, lambda: self._show_recovery_dialog(self.recovery_checkpoint))
+            self._finish_init(scewin_path)
             
         except Exception as e:
             logger.error(f"Ошибка при инициализации сервисов: {e}", exc_info=True)
             self.append_log(f"❌ Ошибка при инициализации сервисов: {str(e)}")
-            self._update_status("Ошибка инициализации")
-            self._set_progress_indeterminate(False)
+            self._post(self._update_status, "Ошибка инициализации")
+            self._post(self._set_progress_indeterminate, False)
             
             # Показываем диалог с ошибкой
             error_message = str(e)  # Сохраняем сообщение об ошибке в переменную
-            self.root.after(0, lambda: messagebox.showerror(
+            self._post(
+                messagebox.showerror,
                 "Ошибка инициализации",
                 f"Не удалось инициализировать сервисы:\n\n{error_message}\n\n"
                 f"Проверьте наличие файла SCEWIN_x64.exe и права администратора."
-            ))
+            )
+    
+    def _finish_init(self, scewin_path):
+        """
+        Завершает инициализацию (в фоновом потоке): сервис BIOS, движок тюнинга,
+        информация о системе. Сервис мониторинга к этому моменту уже создан.
+        
+        Args:
+            scewin_path: Путь к SCEWIN_x64.exe
+        """
+        self.bios = BiosService(scewin_path)
+        
+        # Инициализация движка тюнинга
+        self.append_log("Инициализация движка тюнинга...")
+        self.tuner = TuningEngine(self.monitor, self.bios, checkpoint_dir=self.checkpoint_dir)
+        self.tuner.log_callback = self.append_log
+        
+        # Получаем информацию о системе
+        self.append_log("Получение информации о системе...")
+        system_info = self.monitor.collect_system_info()
+        self._post(self._update_system_info, system_info)
+        
+        # Все сервисы инициализированы
+        self.is_services_initialized = True
+        self._start_monitor_poll()
+        self._post(self._update_status, "Готов к работе")
+        self._post(self._set_progress_indeterminate, False)
+        
+        # Включаем кнопки
+        self._post(self._enable_buttons)
+        
+        # Проверяем наличие точки восстановления
+        if self.recovery_checkpoint:
+            self._post(self._show_recovery_dialog, self.recovery_checkpoint)
     
     def _ask_for_scewin_path(self):
         """Запрашивает у пользователя путь к SCEWIN"""
@@ -304,17 +538,13 @@ class MainWindow:
         
         filepath = filedialog.askopenfilename(
             title="Выберите SCEWIN_x64.exe",
-            filetypes=[("Исполняемые файлы", "*.exe"), ("Все файлы", "*.*")]
+            filetypes=SCEWIN_FILETYPES
         )
         
         if filepath and os.path.exists(filepath):
             # Перезапускаем инициализацию с указанным путем
             self.append_log(f"Выбран SCEWIN: {filepath}")
-            init_thread = threading.Thread(
-                target=lambda: self._continue_init_with_scewin(filepath)
-            )
-            init_thread.daemon = True
-            init_thread.start()
+            self.init_thread = self._start_worker("init", self._continue_init_with_scewin, filepath)
         else:
             self.append_log("❌ SCEWIN не выбран, невозможно продолжить")
             self._update_status("Ошибка инициализации")
@@ -328,36 +558,19 @@ class MainWindow:
     def _continue_init_with_scewin(self, scewin_path):
         """Продолжает инициализацию с указанным путем к SCEWIN"""
         try:
-            self.bios = BiosService(scewin_path)
-            self.tuner = TuningEngine(self.monitor, self.bios, checkpoint_dir=self.checkpoint_dir)
-            self.tuner.log_callback = self.append_log
-            
-            # Получаем информацию о системе
-            system_info = self.monitor.collect_system_info()
-            self._update_system_info(system_info)
+            self._finish_init(scewin_path)
             
-            # Все сервисы инициализированы
-            self.is_services_initialized = True
-            self._update_status("Готов к работе")
-            self._set_progress_indeterminate(False)
-            
-            # Включаем кнопки
-            self.root.after(0, self._enable_buttons)
-            
-            # Проверяем наличие точки восстановления
-            if self.recovery_checkpoint:
-                self.root.after(0, lambda: self._show_recovery_dialog(self.recovery_checkpoint))
-                
         except Exception as e:
             logger.error(f"Ошибка при инициализации с указанным SCEWIN: {e}", exc_info=True)
             self.append_log(f"❌ Ошибка при инициализации с указанным SCEWIN: {str(e)}")
-            self._update_status("Ошибка инициализации")
+            self._post(self._update_status, "Ошибка инициализации")
             
             error_message = str(e)  # Сохраняем сообщение об ошибке в переменную
-            self.root.after(0, lambda: messagebox.showerror(
+            self._post(
+                messagebox.showerror,
                 "Ошибка инициализации",
                 f"Не удалось инициализировать BIOS с указанным SCEWIN:\n\n{error_message}"
-            ))
+            )
     
     def _show_recovery_dialog(self, checkpoint_file):
         """Показывает диалог восстановления после сбоя"""
@@ -372,19 +585,36 @@ class MainWindow:
     
     def _enable_buttons(self):
         """Включает кнопки интерфейса"""
-        self.start_button.config(state=tk.NORMAL)
-        self.load_button.config(state=tk.NORMAL)
-        self.restore_button.config(state=tk.NORMAL)
+        self._set_buttons('ready')
+    
+    def _set_buttons(self, mode):
+        """
+        Переключает кнопки в состояние режима из BUTTON_STATES.
+        
+        Args:
+            mode: Режим окна ('ready', 'running' или 'busy')
+        """
+        for name, state in BUTTON_STATES[mode].items():
+            getattr(self, f"{name}_button").config(state=state)
     
     def _update_status(self, status):
         """Обновляет статус программы"""
+        # Запись в StringVar перерисовывает метку, поэтому тот же текст не записывается
+        if status == self._last_status:
+            return
+        self._last_status = status
         self.status_var.set(status)
     
     def _set_progress_indeterminate(self, indeterminate):
         """Управляет режимом индикатора прогресса"""
+        # Повторный запуск/остановка заново устанавливают таймер анимации Tk
+        if indeterminate == self._progress_indeterminate:
+            return
+        self._progress_indeterminate = indeterminate
+        
         if indeterminate:
             self.progress_bar.config(mode='indeterminate')
-            self.progress_bar.start(15)
+            self.progress_bar.start(PROGRESS_ANIMATION_INTERVAL)
         else:
             self.progress_bar.stop()
             self.progress_bar.config(mode='determinate')
@@ -392,88 +622,157 @@ class MainWindow:
     
     def _schedule_status_update(self):
         """Планирует периодическое обновление статуса"""
-        # Обновляем информацию о системе каждые 10 секунд, если не идет тюнинг
-        if not self.is_tuning_running and self.is_services_initialized:
-            try:
-                # Получаем текущие данные
-                temp, power, load = self.monitor.read_cpu_data()
-                
-                # Обновляем статус
-                status_text = f"Готов к работе | CPU: {load:.0f}% | Темп: {temp:.1f}°C | Мощность: {power:.1f}W"
-                self._update_status(status_text)
+        # Статус свернутого окна никто не видит - поток опроса в это время не читает датчики
+        self._window_iconic = self.root.state() == 'iconic'
+        
+        # Выводим последние данные CPU, если не идет тюнинг и окно не свернуто
+        # (датчики читает фоновый поток, здесь только форматирование)
+        stats = self._latest_stats
+        if (stats is not None and not self.is_tuning_running
+                and self.is_services_initialized and not self._window_iconic):
+            temp, power, load = stats
+            self._update_status(
+                f"Готов к работе | CPU: {load:.0f}% | Темп: {temp:.1f}°C | Мощность: {power:.1f}W")
+        
+        # Перепланируем через STATUS_POLL_INTERVAL
+        self.root.after(STATUS_POLL_INTERVAL, self._schedule_status_update)
+    
+    def _start_monitor_poll(self):
+        """Запускает фоновый поток опроса датчиков CPU для строки статуса"""
+        self._start_worker("monitor-poll", self._monitor_poll_loop)
+    
+    def _monitor_poll_loop(self):
+        """Цикл фонового потока: читает датчики CPU раз в STATUS_POLL_INTERVAL"""
+        # WMI-объекты монитора привязаны к потоку инициализации, поэтому поток
+        # опроса открывает собственные подключения
+        self.monitor.attach_thread()
+        try:
+            while True:
+                # Во время тюнинга датчики опрашивает движок, а статус свернутого окна не виден
+                if not self.is_tuning_running and not self._window_iconic:
+                    try:
+                        self._latest_stats = self.monitor.read_cpu_data()
+                    except Exception as e:
+                        logger.debug(f"Ошибка при опросе датчиков CPU: {e}")
                 
-            except Exception as e:
-                logger.debug(f"Ошибка при обновлении статуса: {e}")
-        
-        # Перепланируем через 2 секунды
-        self.root.after(2000, self._schedule_status_update)
+                if self._monitor_stop.wait(STATUS_POLL_INTERVAL / 1000):
+                    break
+        finally:
+            self.monitor.detach_thread()
     
     def append_log(self, message):
-        """Добавляет сообщение в лог"""
-        # Убедимся, что выполняется в UI потоке
-        if threading.current_thread() is not threading.main_thread():
-            self.root.after(0, lambda: self.append_log(message))
-            return
-        
-        # Текущее время
-        timestamp = time.strftime("%H:%M:%S")
+        """Добавляет сообщение в лог (можно вызывать из любого потока)"""
+        # Текущее время (форматируется только при смене секунды)
+        now = int(time.time())
+        second, timestamp = self._log_timestamp
+        if now != second:
+            timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+            self._log_timestamp = (now, timestamp)
+        
+        # Сообщение только попадает в очередь, а в виджет его выводит таймер
+        # _flush_log в UI потоке; многострочное сообщение занимает несколько строк списка
+        lines = str(message).splitlines() or [""]
+        lines[0] = f"[{timestamp}] {lines[0]}"
+        for i in range(1, len(lines)):
+            lines[i] = f"    {lines[i]}"
+        self._log_queue.extend(lines)
+        
+        # Несколько сообщений подряд из обработчика в UI потоке выводятся одной
+        # вставкой сразу после обработчика, не дожидаясь таймера (фоновые потоки
+        # к Tk не обращаются)
+        if not self._log_idle_pending and threading.get_ident() == self._ui_thread_id:
+            self._log_idle_pending = True
+            self.root.after_idle(self._flush_log_idle)
+    
+    def _flush_log_idle(self):
+        """Выводит строки лога, добавленные из UI потока"""
+        self._log_idle_pending = False
+        self._write_log_lines()
+    
+    def _flush_log(self):
+        """Периодически выводит накопленные строки в лог"""
+        self._write_log_lines()
         
-        # Добавляем сообщение в лог
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)  # Прокрутка к концу
-        self.log_text.config(state=tk.DISABLED)
+        # Перепланируем через LOG_FLUSH_INTERVAL
+        self.root.after(LOG_FLUSH_INTERVAL, self._flush_log)
+    
+    def _write_log_lines(self):
+        """Выводит накопленные строки в лог одной вставкой"""
+        pending = self._log_queue
+        if pending:
+            # Из большой пачки в виджете все равно останутся только последние строки
+            lines = [pending.popleft() for _ in range(len(pending))][-LOG_MAX_LINES:]
+            self.log_list.insert(tk.END, *lines)
+            
+            # Ограничиваем размер лога, чтобы стоимость обновления виджета не росла
+            # с длительностью тюнинга
+            excess = self.log_list.size() - LOG_MAX_LINES
+            if excess > 0:
+                self.log_list.delete(0, excess - 1)
+            
+            self.log_list.see(tk.END)  # Прокрутка к концу
     
     def _update_results(self, profile):
         """Обновляет вкладку результатов с данными из профиля"""
         if not profile:
             return
         
-        # Генерируем отчет
-        report = profile.generate_report()
+        # Отчет скрытой вкладки формируется при ее открытии (_on_tab_changed)
+        self._results_profile = profile
+        if self._lazy_tabs.get(self.notebook.select()) == 'results':
+            self._render_results()
+        else:
+            self._results_dirty = True
+    
+    def _render_results(self):
+        """Формирует отчет по профилю и выводит его на вкладку результатов"""
+        self._results_dirty = False
+        report = self._results_profile.generate_report()
+        self._set_tab_text('results', report)
+    
+    @staticmethod
+    def _flatten_system_info(system_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Собирает поля шаблона SYSINFO_TEMPLATE из вложенного словаря системной информации.
         
-        # Обновляем текстовое поле
-        self.results_text.config(state=tk.NORMAL)
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, report)
-        self.results_text.config(state=tk.DISABLED)
+        Args:
+            system_info: Словарь от HardwareMonitorService.collect_system_info
+            
+        Returns:
+            Плоский словарь полей шаблона
+        """
+        sections = {
+            None: system_info,
+            'cpu': system_info.get('cpu') or _EMPTY_SECTION,
+            'memory': system_info.get('memory') or _EMPTY_SECTION,
+        }
+        return {field: sections[section].get(key, default)
+                for field, section, key, default in SYSINFO_FIELDS}
     
     def _update_system_info(self, system_info):
         """Обновляет информацию о системе"""
         if not system_info:
             return
         
+        flat = self._flatten_system_info(system_info)
+        frequencies = system_info.get('cpu_frequencies') or {}
+        
+        # Виджет перерисовывается, только если данные изменились
+        key = (tuple(flat.values()), tuple(frequencies.items()))
+        if key == self._last_sysinfo_key:
+            return
+        self._last_sysinfo_key = key
+        
         # Форматируем информацию
-        info_text = [
-            "=== Информация о системе ===",
-            f"Платформа: {system_info.get('platform', 'Неизвестно')}",
-            f"Процессор: {system_info.get('cpu', {}).get('brand_raw', 'Неизвестно')}",
-            f"Ядра/потоки: {system_info.get('cpu', {}).get('core_count', 0)}/{system_info.get('cpu', {}).get('thread_count', 0)}",
-            f"Архитектура: {system_info.get('cpu', {}).get('arch', 'Неизвестно')}",
-            "",
-            "=== Оперативная память ===",
-            f"Всего: {system_info.get('memory', {}).get('total_gb', 0):.1f} ГБ",
-            f"Использовано: {system_info.get('memory', {}).get('used_gb', 0):.1f} ГБ ({system_info.get('memory', {}).get('percent', 0)}%)",
-            "",
-            "=== Текущее состояние ===",
-            f"Температура CPU: {system_info.get('cpu_temperature', 0):.1f}°C",
-            f"Мощность CPU: {system_info.get('cpu_power', 0):.1f}W",
-            f"Загрузка CPU: {system_info.get('cpu_load', 0):.1f}%",
-        ]
+        info_text = SYSINFO_TEMPLATE.format_map(flat)
         
         # Добавляем частоты, если доступны
-        if 'cpu_frequencies' in system_info and system_info['cpu_frequencies']:
-            info_text.append("")
-            info_text.append("=== Частоты CPU ===")
-            
-            for core, freq in system_info['cpu_frequencies'].items():
-                info_text.append(f"{core}: {freq:.0f} МГц")
+        if frequencies:
+            info_text += "\n\n=== Частоты CPU ===\n" + "\n".join(
+                f"{core}: {freq:.0f} МГц" for core, freq in frequencies.items())
         
         # Обновляем текстовое поле
-        self.sysinfo_text.config(state=tk.NORMAL)
-        self.sysinfo_text.delete(1.0, tk.END)
-        self.sysinfo_text.insert(tk.END, "\n".join(info_text))
-        self.sysinfo_text.config(state=tk.DISABLED)
+        self._set_tab_text('sysinfo', info_text)
     
     def _on_start_tuning(self, recovery_checkpoint=None):
         """Обработчик нажатия кнопки 'Запустить тюнинг'"""
@@ -509,23 +808,14 @@ class MainWindow:
         self._set_progress_indeterminate(True)
         
         # Обновляем состояние кнопок
-        self.start_button.config(state=tk.DISABLED)
-        self.load_button.config(state=tk.DISABLED)
-        self.save_button.config(state=tk.DISABLED)
-        self.restore_button.config(state=tk.DISABLED)
-        self.stop_button.config(state=tk.NORMAL)
+        self._set_buttons('running')
         
         # Обновляем статус через колбек
         if self.state_callback:
             self.state_callback('in_progress')
         
         # Запускаем процесс тюнинга в отдельном потоке
-        tuning_thread = threading.Thread(
-            target=self._run_tuning_process,
-            args=(recovery_checkpoint,)
-        )
-        tuning_thread.daemon = True
-        tuning_thread.start()
+        self._start_worker("tuning", self._run_tuning_process, recovery_checkpoint)
     
     def _run_tuning_process(self, recovery_checkpoint=None):
         """Запускает процесс тюнинга в отдельном потоке"""
@@ -539,13 +829,13 @@ class MainWindow:
             # Проверяем, не требуется ли перезагрузка
             if self.current_profile.requires_reboot:
                 self.requires_reboot = True
-                self.root.after(0, self._show_reboot_required_dialog)
+                self._post(self._show_reboot_required_dialog)
             
             # Обновляем результаты
-            self.root.after(0, lambda: self._update_results(self.current_profile))
+            self._post(self._update_results, self.current_profile)
             
             # Обновляем состояние
-            self.root.after(0, self._on_tuning_completed)
+            self._post(self._on_tuning_completed)
             
         except Exception as e:
             logger.error(f"Ошибка в процессе тюнинга: {e}", exc_info=True)
@@ -553,7 +843,7 @@ class MainWindow:
             
             # Обновляем состояние
             error_message = str(e)  # Сохраняем сообщение об ошибке в переменную
-            self.root.after(0, lambda: self._on_tuning_error(error_message))
+            self._post(self._on_tuning_error, error_message)
     
     def _on_tuning_completed(self):
         """Вызывается при успешном завершении тюнинга"""
@@ -562,16 +852,12 @@ class MainWindow:
         self._set_progress_indeterminate(False)
         
         # Обновляем состояние кнопок
-        self.start_button.config(state=tk.NORMAL)
-        self.load_button.config(state=tk.NORMAL)
-        self.stop_button.config(state=tk.DISABLED)
+        self._set_buttons('ready')
         
         # Если есть профиль, включаем кнопку сохранения
         if self.current_profile:
             self.save_button.config(state=tk.NORMAL)
         
-        self.restore_button.config(state=tk.NORMAL)
-        
         # Обновляем статус через колбек
         if self.state_callback:
             self.state_callback('completed')
@@ -595,10 +881,7 @@ class MainWindow:
         self._set_progress_indeterminate(False)
         
         # Обновляем состояние кнопок
-        self.start_button.config(state=tk.NORMAL)
-        self.load_button.config(state=tk.NORMAL)
-        self.stop_button.config(state=tk.DISABLED)
-        self.restore_button.config(state=tk.NORMAL)
+        self._set_buttons('ready')
         
         # Обновляем статус через колбек
         if self.state_callback:
@@ -625,9 +908,17 @@ class MainWindow:
             if self.state_callback:
                 self.state_callback('reboot_pending')
             
-            # Запускаем перезагрузку
+            # Запускаем перезагрузку (без cmd.exe и без ожидания завершения команды;
+            # результат проверяет _check_reboot_command)
             try:
-                os.system("shutdown /r /t 5 /c \"Перезагрузка для применения настроек BIOS\"")
+                process = subprocess.Popen(
+                    REBOOT_COMMAND,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    creationflags=CREATE_NO_WINDOW
+                )
+                self.root.after(REBOOT_CHECK_INTERVAL, self._check_reboot_command, process)
                 messagebox.showinfo(
                     "Перезагрузка",
                     "Компьютер будет перезагружен через 5 секунд.\n\n"
@@ -641,6 +932,24 @@ class MainWindow:
                     f"Перезагрузите компьютер вручную."
                 )
     
+    def _check_reboot_command(self, process):
+        """Проверяет результат команды перезагрузки, не блокируя UI поток"""
+        if process.poll() is None:
+            self.root.after(REBOOT_CHECK_INTERVAL, self._check_reboot_command, process)
+            return
+        
+        stderr = process.stderr.read()
+        process.stderr.close()
+        if process.returncode != 0:
+            # shutdown выводит сообщения в OEM-кодировке консоли
+            message = stderr.decode('oem' if os.name == 'nt' else 'utf-8', 'replace').strip()
+            logger.error(f"Ошибка при перезагрузке: код {process.returncode}, {message}")
+            messagebox.showerror(
+                "Ошибка перезагрузки",
+                f"Не удалось выполнить перезагрузку: {message or f'код {process.returncode}'}\n\n"
+                f"Перезагрузите компьютер вручную."
+            )
+    
     def _on_stop_tuning(self):
         """Обработчик нажатия кнопки 'Остановить'"""
         if not self.is_tuning_running:
@@ -675,7 +984,7 @@ class MainWindow:
         # Открываем диалог выбора файла
         filepath = filedialog.askopenfilename(
             title="Загрузить профиль CPU",
-            filetypes=[("JSON файлы", "*.json"), ("Все файлы", "*.*")]
+            filetypes=PROFILE_FILETYPES
         )
         
         if not filepath:
@@ -733,8 +1042,8 @@ class MainWindow:
         self._set_progress_indeterminate(True)
         
         try:
-            # Получаем измененные параметры
-            modified_params = profile.get_modified_parameters()
+            # Получаем измененные параметры в порядке применения
+            modified_params = profile.get_ordered_modified_parameters()
             
             if not modified_params:
                 self.append_log("⚠️ В профиле нет измененных параметров")
@@ -744,14 +1053,13 @@ class MainWindow:
                 )
                 return
             
-            # Применяем настройки
-            for param, value in modified_params.items():
-                try:
-                    self.append_log(f"Установка {param} = {value}")
-                    self.bios.set_setting_value(param, value)
-                except Exception as e:
-                    logger.error(f"Ошибка при установке {param}: {e}", exc_info=True)
-                    self.append_log(f"⚠️ Не удалось установить {param}: {str(e)}")
+            # Применяем все настройки одним импортом SCEWIN
+            for param, value in modified_params:
+                self.append_log(f"Установка {param} = {value}")
+            errors = self.bios.set_setting_values(dict(modified_params))
+            for param, error in errors.items():
+                logger.error(f"Ошибка при установке {param}: {error}")
+                self.append_log(f"⚠️ Не удалось установить {param}: {error}")
             
             self.append_log("✅ Профиль успешно применен")
             
@@ -779,106 +1087,110 @@ class MainWindow:
     
     def _on_save_profile(self):
         """Обработчик нажатия кнопки 'Сохранить профиль'"""
+        # Кнопку могут снова включить другие действия, пока предыдущее сохранение
+        # не завершено - повторная запись того же профиля не запускается
+        if self._save_in_progress:
+            return
+        
         if not self.current_profile:
-            messagebox.showinfo(
-                "Нет профиля",
-                "Нет текущего профиля для сохранения.\n\n"
-                "Сначала выполните тюнинг или загрузите профиль."
-            )
+            messagebox.showinfo(*MSG_NO_PROFILE)
             return
         
         # Открываем диалог сохранения файла
         filepath = filedialog.asksaveasfilename(
             title="Сохранить профиль CPU",
             defaultextension=".json",
-            filetypes=[("JSON файлы", "*.json"), ("Все файлы", "*.*")],
+            filetypes=PROFILE_FILETYPES,
             initialfile=f"{self.current_profile.profile_name}.json"
         )
         
         if not filepath:
             return  # Пользователь отменил сохранение
         
+        # Профиль записывается в фоновом потоке, результат обрабатывает _on_profile_saved
+        self._save_in_progress = True
+        self.save_button.config(state=tk.DISABLED)
+        self._start_worker("save-profile", self._save_profile_worker, self.current_profile, filepath)
+    
+    def _save_profile_worker(self, profile, filepath):
+        """Сохраняет профиль в файл (в фоновом потоке)"""
         try:
-            # Сохраняем профиль
-            self.current_profile.save_to_file(filepath)
-            self.append_log(f"Профиль сохранен в {filepath}")
-            
-            messagebox.showinfo(
-                "Профиль сохранен",
-                f"Профиль успешно сохранен в файл:\n{filepath}"
-            )
-            
+            profile.save_to_file(filepath)
+            error = None
         except Exception as e:
             logger.error(f"Ошибка при сохранении профиля: {e}", exc_info=True)
-            self.append_log(f"❌ Ошибка при сохранении профиля: {str(e)}")
-            
-            messagebox.showerror(
-                "Ошибка сохранения профиля",
-                f"Не удалось сохранить профиль: {str(e)}"
-            )
+            error = e
+        self._post(self._on_profile_saved, filepath, error)
+    
+    def _on_profile_saved(self, filepath, error):
+        """Сообщает о результате сохранения профиля (в UI потоке)"""
+        self._save_in_progress = False
+        if not self.is_tuning_running:
+            self.save_button.config(state=tk.NORMAL)
+        
+        if error is None:
+            self.append_log(f"Профиль сохранен в {filepath}")
+            title, text = MSG_PROFILE_SAVED
+            messagebox.showinfo(title, text.format(path=filepath))
+        else:
+            self.append_log(f"❌ Ошибка при сохранении профиля: {str(error)}")
+            title, text = MSG_PROFILE_SAVE_FAILED
+            messagebox.showerror(title, text.format(error=error))
     
     def _on_restore_defaults(self):
         """Обработчик нажатия кнопки 'Восстановить настройки'"""
         if not self.is_services_initialized:
-            messagebox.showerror(
-                "Ошибка",
-                "Сервисы не инициализированы. Невозможно восстановить настройки."
-            )
+            messagebox.showerror(*MSG_RESTORE_UNAVAILABLE)
             return
         
-        confirm = messagebox.askyesno(
-            "Подтверждение восстановления",
-            "Вы уверены, что хотите восстановить настройки BIOS до исходных значений?\n\n"
-            "Все изменения, сделанные тюнером, будут сброшены."
-        )
+        confirm = messagebox.askyesno(*MSG_CONFIRM_RESTORE)
         
         if not confirm:
             return
         
-        # Восстанавливаем настройки
+        # Восстанавливаем настройки в фоновом потоке (SCEWIN работает долго);
+        # до завершения кнопки отключены
         self.append_log("Восстановление исходных настроек BIOS...")
         self._update_status("Восстановление настроек...")
         self._set_progress_indeterminate(True)
-        
+        self._set_buttons('busy')
+        self._start_worker("restore-defaults", self._restore_defaults_worker)
+    
+    def _restore_defaults_worker(self):
+        """Восстанавливает исходные настройки BIOS (в фоновом потоке)"""
         try:
             # Вызываем метод восстановления в BiosService
             result = self.bios.restore_defaults()
-            
-            if result:
-                self.append_log("✅ Настройки BIOS успешно восстановлены")
-                messagebox.showinfo(
-                    "Настройки восстановлены",
-                    "Исходные настройки BIOS успешно восстановлены."
-                )
-            else:
-                self.append_log("⚠️ Не удалось восстановить настройки BIOS")
-                messagebox.showwarning(
-                    "Предупреждение",
-                    "Не удалось восстановить исходные настройки BIOS.\n\n"
-                    "Проверьте лог для получения дополнительной информации."
-                )
-            
+            error = None
         except Exception as e:
             logger.error(f"Ошибка при восстановлении настроек: {e}", exc_info=True)
-            self.append_log(f"❌ Ошибка при восстановлении настроек: {str(e)}")
-            
-            messagebox.showerror(
-                "Ошибка восстановления",
-                f"Не удалось восстановить настройки: {str(e)}"
-            )
-        finally:
-            self._update_status("Готов к работе")
-            self._set_progress_indeterminate(False)
+            result, error = False, e
+        self._post(self._on_defaults_restored, result, error)
+    
+    def _on_defaults_restored(self, result, error):
+        """Сообщает о результате восстановления настроек (в UI потоке)"""
+        self._update_status("Готов к работе")
+        self._set_progress_indeterminate(False)
+        self._set_buttons('ready')
+        if self.current_profile:
+            self.save_button.config(state=tk.NORMAL)
+        
+        if error is not None:
+            self.append_log(f"❌ Ошибка при восстановлении настроек: {str(error)}")
+            title, text = MSG_RESTORE_FAILED
+            messagebox.showerror(title, text.format(error=error))
+        elif result:
+            self.append_log("✅ Настройки BIOS успешно восстановлены")
+            messagebox.showinfo(*MSG_RESTORED)
+        else:
+            self.append_log("⚠️ Не удалось восстановить настройки BIOS")
+            messagebox.showwarning(*MSG_RESTORE_INCOMPLETE)
     
     def _on_close(self):
         """Обработчик закрытия окна"""
         # Если идет тюнинг, спрашиваем подтверждение
         if self.is_tuning_running:
-            confirm = messagebox.askyesno(
-                "Прервать тюнинг?",
-                "В данный момент идет процесс тюнинга.\n\n"
-                "Вы уверены, что хотите закрыть программу и прервать тюнинг?"
-            )
+            confirm = messagebox.askyesno(*MSG_CONFIRM_CLOSE)
             
             if not confirm:
                 return
@@ -887,12 +1199,15 @@ class MainWindow:
             if hasattr(self, 'tuner') and self.tuner:
                 self.tuner.abort()
         
+        # Останавливаем опрос датчиков и закрываем окно сразу: abort() только
+        # выставляет флаг, а закрытие сервиса мониторинга может ждать поток
+        # OpenHardwareMonitor до 2 с - пользователь этого уже не видит
+        self._monitor_stop.set()
+        self.root.destroy()
+        
         # Закрываем сервисы
         if hasattr(self, 'monitor') and self.monitor:
             try:
                 self.monitor.close()
-            except:
-                pass
-        
-        # Закрываем окно
-        self.root.destroy()
\ No newline at end of file
+            except Exception as e:
+                logger.warning(f"Ошибка при закрытии сервиса мониторинга: {e}")
\ No newline at end of file
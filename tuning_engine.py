@@ -15,6 +15,22 @@ from cpu_profile import CPUProfile, StressTestResult
 from hardware_monitor import HardwareMonitorService
 from bios_service import BiosService
 
+# orjson (если установлен) сериализует точки восстановления быстрее стандартного json;
+# обе реализации пишут компактный JSON в байтах UTF-8
+try:
+    import orjson
+    
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    # Без отступов стандартный кодировщик работает через C-ускоритель
+    _JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+    
+    def _dumps(data: Any) -> bytes:
+        return _JSON_ENCODER.encode(data).encode('utf-8')
+    
+    _loads = json.loads
+
 logger = logging.getLogger("cpu_tuner")
 
 class TuningEngine:
@@ -89,11 +105,15 @@ class TuningEngine:
             "timestamp": timestamp,
             "stage": stage,
             "detail": detail,
-            "profile": json.loads(profile.to_json())
+            "profile": profile.as_dict()
         }
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(checkpoint, f, indent=2)
+        # Компактная запись во временный файл с атомарной заменой: при сбое
+        # во время записи точка восстановления не окажется недописанной
+        temp_path = filepath + ".tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(_dumps(checkpoint))
+        os.replace(temp_path, filepath)
             
         logger.info(f"Сохранена точка восстановления: {filename}")
         return filename
@@ -110,10 +130,10 @@ class TuningEngine:
         """
         filepath = os.path.join(self.checkpoint_dir, filename)
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            checkpoint = json.load(f)
+        with open(filepath, 'rb') as f:
+            checkpoint = _loads(f.read())
         
-        profile = CPUProfile.from_json(json.dumps(checkpoint["profile"]))
+        profile = CPUProfile.from_dict(checkpoint["profile"])
         stage = checkpoint.get("stage", "")
         detail = checkpoint.get("detail", "")
         
@@ -256,9 +276,13 @@ class TuningEngine:
             # Применяем лучшие настройки, если они есть
             self._apply_best_settings(profile)
             
-            # Сохраняем финальный профиль
+            # Сохраняем финальный профиль. Тюнинг к этому моменту завершен, поэтому
+            # ошибка записи (например, каталог недоступен для записи) не прерывает отчет
             profile_path = "best_profile.json"
-            profile.save_to_file(profile_path)
+            try:
+                profile.save_to_file(profile_path)
+            except Exception as e:
+                self.log(f"⚠️ Не удалось сохранить профиль в {profile_path}: {e}")
             
             # Генерируем отчет
             report = profile.generate_report()
@@ -1033,7 +1057,7 @@ class TuningEngine:
                     self.log(f"Отключение C-States дало прирост производительности: "
                            f"+{(perf_ratio-1)*100:.2f}%. Сохраняем изменения.")
                     # Изменения уже применены, просто обновляем профиль
-                    profile.bios_parameters[main_cstate_param].best_value = disable_value
+                    profile.set_best_value(main_cstate_param, disable_value)
                 else:
                     # Нет значимого прироста или даже падение
                     self.log(f"Отключение C-States не дало значимого прироста производительности "
@@ -1167,16 +1191,23 @@ class TuningEngine:
         """
         self.log("Применение сохраненных настроек профиля...")
         
-        # Получаем все измененные параметры
-        modified_params = profile.get_modified_parameters()
+        # Получаем все измененные параметры в порядке применения
+        modified_params = profile.get_ordered_modified_parameters()
         
-        for param_name, value in modified_params.items():
-            try:
-                self.log(f"Восстановление параметра: {param_name} = {value}")
-                self.bios.set_setting_value(param_name, value)
-            except Exception as e:
-                logger.error(f"Не удалось восстановить параметр {param_name}: {e}")
-                self.log(f"⚠️ Не удалось восстановить параметр {param_name}: {str(e)}")
+        for param_name, value in modified_params:
+            self.log(f"Восстановление параметра: {param_name} = {value}")
+        
+        # Все параметры применяются одним импортом SCEWIN
+        try:
+            errors = self.bios.set_setting_values(dict(modified_params))
+        except Exception as e:
+            logger.error(f"Не удалось восстановить параметры: {e}")
+            self.log(f"⚠️ Не удалось восстановить параметры: {str(e)}")
+            return
+        
+        for param_name, error in errors.items():
+            logger.error(f"Не удалось восстановить параметр {param_name}: {error}")
+            self.log(f"⚠️ Не удалось восстановить параметр {param_name}: {error}")
     
     def _apply_best_settings(self, profile: CPUProfile) -> None:
         """